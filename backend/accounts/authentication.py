@@ -0,0 +1,96 @@
+"""
+JWT 인증 클래스
+Why: 같은 access 토큰으로 반복되는 요청에서 토큰 검증 비용을 줄임
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+# 검증 결과 캐시 유지 시간 (초) - 토큰 남은 수명보다 길게 유지하지 않음
+JWT_CACHE_TIMEOUT = 60
+
+
+def _token_cache_key(raw_token) -> str:
+    """access 토큰 문자열의 캐시 키 (토큰 원문 대신 다이제스트 사용)"""
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return f"jwt:{hashlib.blake2b(raw_token, digest_size=16).hexdigest()}"
+
+
+def forget_cached_token(validated_token) -> None:
+    """
+    access 토큰의 검증 캐시 무효화 (로그아웃 시 호출)
+
+    Args:
+        validated_token (Token | None): request.auth (인증되지 않은 요청이면 None)
+    """
+    if validated_token is None:
+        return
+    cache.delete(_token_cache_key(validated_token.token))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    검증 결과를 짧은 TTL로 캐시하는 JWTAuthentication
+
+    - 토큰 검증(base64 디코딩 + JSON 파싱 + 서명 검증) 결과를 토큰 문자열 기준으로 캐시
+      (검증 결과는 토큰 문자열만으로 결정되므로 프로세스별 캐시여도 달라지지 않음)
+    - 캐시 시간은 JWT_CACHE_TIMEOUT과 토큰 남은 수명 중 짧은 쪽
+    - 사용자 객체는 캐시하지 않음: 기본 캐시는 프로세스별 LocMemCache라 다른 워커의
+      무효화가 전달되지 않으므로, 계정 비활성화/권한 변경이 즉시 반영되도록 매 요청 DB 조회
+    - 매 요청의 사용자 조회는 light()로 bio/profile_image 컬럼을 제외
+      (프로필 응답은 UserProfileViewSet.get_queryset()에서 따로 조회)
+    """
+
+    def get_validated_token(self, raw_token):
+        key = _token_cache_key(raw_token)
+        validated_token = cache.get(key)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            timeout = min(JWT_CACHE_TIMEOUT, int(validated_token["exp"] - time.time()))
+            if timeout > 0:
+                cache.set(key, validated_token, timeout)
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        JWTAuthentication.get_user()와 동일하되 User.objects.light()로 조회
+
+        Why: request.user는 권한 확인과 pk/updated_at 참조에만 쓰이므로
+        모든 인증 요청에서 큰 프로필 컬럼을 전송하지 않음
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        try:
+            user = self.user_model.objects.light().get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,21 @@
+"""
+Password hashers for the accounts app.
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher as BaseArgon2PasswordHasher
+
+
+class Argon2PasswordHasher(BaseArgon2PasswordHasher):
+    """
+    Argon2id tuned for interactive logins.
+
+    Uses the OWASP minimum (19 MiB memory, 2 iterations, 1 lane) instead of
+    Django's 100 MiB / 8 lanes, which keeps login verification fast without
+    dropping below the recommended strength. The algorithm name is unchanged,
+    so hashes made with other parameters still verify and are re-hashed with
+    these on the next successful login (must_update).
+    """
+
+    time_cost = 2
+    memory_cost = 19456  # KiB
+    parallelism = 1
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def lowercase_emails(apps, schema_editor):
+    # 기존 계정 이메일도 소문자로 정규화 (로그인 시 정확 일치 조회와 맞춤)
+    User = apps.get_model("accounts", "User")
+
+    # Why: 대소문자만 다른 이메일(A@x.com / a@x.com)이 있으면 아래 UPDATE가
+    # 기존 unique(email) 제약에 걸려 IntegrityError로 중단되므로,
+    # 어떤 계정을 남길지는 운영자가 정하도록 중복 목록과 함께 먼저 실패시킴
+    by_lower_email = User.objects.annotate(
+        email_lower=django.db.models.functions.text.Lower("email")
+    )
+    duplicates = (
+        by_lower_email.values("email_lower")
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+        .values("email_lower")
+    )
+    accounts = list(
+        by_lower_email.filter(email_lower__in=duplicates).order_by("email_lower", "id")
+    )
+    if accounts:
+        raise RuntimeError(
+            "대소문자만 다른 중복 이메일이 있어 소문자로 정규화할 수 없습니다. "
+            "계정을 병합/수정한 뒤 다시 migrate 하세요:\n"
+            + "\n".join(f"  id={user.id} email={user.email}" for user in accounts)
+        )
+
+    User.objects.exclude(email=django.db.models.functions.text.Lower("email")).update(
+        email=django.db.models.functions.text.Lower("email")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_user_active_email_partial_index"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="users_lower_email_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:13
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_user_lower_email_unique"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="phone_number",
+            field=models.CharField(
+                blank=True,
+                max_length=17,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="올바른 전화번호 형식(예: 010-1234-5678 또는 +821012345678)을 입력해주세요.",
+                        regex=re.compile(
+                            "^(010-?\\d{4}-?\\d{4}|\\+\\d{1,4}\\d{7,14})$"
+                        ),
+                    )
+                ],
+            ),
+        ),
+    ]
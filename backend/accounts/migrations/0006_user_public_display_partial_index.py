@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_precompiled_phone_regex"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="user",
+            name="users_display_32b2ed_idx",
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_portfolio_public", True)),
+                fields=["display_name"],
+                name="users_public_display_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:20
+
+import re
+
+from django.db import migrations, models
+
+
+def normalize_phone_numbers(apps, schema_editor):
+    # 기존 전화번호를 E.164로 변환 (010-1234-5678 -> +821012345678)
+    # 변환할 수 없는 값은 제약조건 추가 전에 비움
+    User = apps.get_model("accounts", "User")
+    users = list(User.objects.exclude(phone_number="").only("id", "phone_number"))
+    for user in users:
+        number = user.phone_number.replace("-", "")
+        if number.startswith("010"):
+            number = "+82" + number[1:]
+        user.phone_number = number if re.match(r"^\+\d{8,15}$", number) else ""
+    User.objects.bulk_update(users, ["phone_number"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_user_queryset_manager"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_phone_numbers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="user",
+            name="phone_number",
+            field=models.CharField(blank=True, max_length=17),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("phone_number", ""),
+                    ("phone_number__regex", "^\\+\\d{8,15}$"),
+                    _connector="OR",
+                ),
+                name="users_phone_e164",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:53
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    # createsuperuser/admin 등 BaseUserManager.normalize_email(도메인만 소문자)로
+    # 저장된 계정도 로그인 조회(소문자 정확 일치)와 맞춤
+    # (users_lower_email_uniq 제약으로 소문자 기준 중복은 존재할 수 없음)
+    User = apps.get_model("accounts", "User")
+    User.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_user_phone_e164"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -3,9 +3,67 @@ Custom User model for designer portfolio platform.
 Following Fat Models principle - business logic concentrated in model methods.
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser
-from django.core.validators import RegexValidator
+from django.contrib.auth.models import UserManager as BaseUserManager
 from django.db import models
+from django.db.models.functions import Lower
+
+# Accepted input: Korean mobile (010-1234-5678) or international (+821012345678).
+# Compiled once at import so validation never hits the lazy re cache.
+PHONE_NUMBER_RE = re.compile(r"^(010-?\d{4}-?\d{4}|\+\d{1,4}\d{7,14})$")
+
+# Stored form: E.164 (+821012345678), enforced by the users_phone_e164 constraint.
+PHONE_E164_REGEX = r"^\+\d{8,15}$"
+PHONE_E164_RE = re.compile(PHONE_E164_REGEX)
+
+
+def normalize_phone_number(value):
+    """
+    Convert an accepted phone number input to E.164.
+
+    "010-1234-5678" -> "+821012345678"; "+821012345678" is kept as is.
+    Empty input stays empty. Raises ValueError for anything else.
+    """
+    if not value:
+        return ""
+    if not PHONE_NUMBER_RE.match(value):
+        raise ValueError(value)
+    if value.startswith("010"):
+        value = "+82" + value.replace("-", "")[1:]
+    if not PHONE_E164_RE.match(value):
+        raise ValueError(value)
+    return value
+
+
+class UserQuerySet(models.QuerySet):
+    """Query helpers for User."""
+
+    def light(self):
+        """
+        Skip the large profile columns (bio text, image path).
+        Use on auth-only or list paths that never render them; touching a
+        deferred field afterwards costs one extra query per row.
+        """
+        return self.defer("profile_image", "bio")
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    """Django's UserManager (create_user, ...) plus UserQuerySet helpers."""
+
+    @classmethod
+    def normalize_email(cls, email):
+        """
+        Lowercase the whole address, not just the domain.
+
+        Login and the serializers look emails up in lowercase, so accounts
+        created via create_user/createsuperuser/admin must be stored the same way.
+        """
+        return super().normalize_email(email).lower()
 
 
 class User(AbstractUser):
@@ -49,13 +107,9 @@ class User(AbstractUser):
     # Contact information
     website = models.URLField(blank=True, help_text="Personal or professional website")
 
-    phone_validator = RegexValidator(
-        regex=r"^(010-?\d{4}-?\d{4}|\+\d{1,4}\d{7,14})$",
-        message="올바른 전화번호 형식(예: 010-1234-5678 또는 +821012345678)을 입력해주세요.",
-    )
-    phone_number = models.CharField(
-        validators=[phone_validator], max_length=17, blank=True
-    )
+    # Stored in E.164; serializers normalize input via normalize_phone_number()
+    # and the database enforces the format (users_phone_e164 constraint).
+    phone_number = models.CharField(max_length=17, blank=True)
 
     # Profile image (requires Pillow)
     profile_image = models.ImageField(
@@ -70,6 +124,11 @@ class User(AbstractUser):
     # Timestamps
     updated_at = models.DateTimeField(auto_now=True)
 
+    # 경험 많은 디자이너 기준 연차 (모델 메서드와 쿼리 annotation이 공유)
+    EXPERIENCED_DESIGNER_YEARS = 3
+
+    objects = UserManager()
+
     # Authentication configuration (Stateless API)
     USERNAME_FIELD = "email"  # Use email for login
     REQUIRED_FIELDS = ["username", "display_name"]
@@ -78,10 +137,31 @@ class User(AbstractUser):
         db_table = "users"
         verbose_name = "User"
         verbose_name_plural = "Users"
+        # 대소문자 무시 이메일 유일성 (가입/로그인 시 소문자로 정규화하여 저장)
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="users_lower_email_uniq"),
+            # 전화번호는 E.164 형식으로만 저장 (DB에서 쓰기 시점에 한 번 검증)
+            models.CheckConstraint(
+                condition=models.Q(phone_number="")
+                | models.Q(phone_number__regex=PHONE_E164_REGEX),
+                name="users_phone_e164",
+            ),
+        ]
         # Performance indexes for frequent queries
         indexes = [
-            models.Index(fields=["email", "is_active"]),
-            models.Index(fields=["display_name"]),
+            # email은 unique 인덱스가 있으므로 활성 사용자 조회용 partial 인덱스만 추가
+            # Why: is_active는 선택도가 낮아 복합 인덱스의 두 번째 키로 효과가 없음
+            models.Index(
+                fields=["email"],
+                condition=models.Q(is_active=True),
+                name="users_active_email_idx",
+            ),
+            # 공개 포트폴리오 목록/검색용 partial 인덱스 (display_name 정렬 상태로 조회)
+            models.Index(
+                fields=["display_name"],
+                condition=models.Q(is_portfolio_public=True),
+                name="users_public_display_idx",
+            ),
             models.Index(fields=["specialization"]),
         ]
 
@@ -89,6 +169,37 @@ class User(AbstractUser):
         """String representation for admin and debugging."""
         return f"{self.display_name} ({self.email})"
 
+    @classmethod
+    def bulk_register(cls, rows, batch_size=1000):
+        """
+        Create many users at once (seeders, admin imports).
+
+        Each row is a dict of User fields plus a raw "password".
+        Passwords are hashed in a thread pool (the Argon2/PBKDF2 C
+        implementations release the GIL) and rows are inserted with
+        bulk_create instead of one create_user() round trip per user.
+        Note: bulk_create skips save() and post_save signals.
+        Emails are lowercased and phone numbers converted to E.164 up front
+        (the users_phone_e164 constraint would otherwise fail the whole
+        batch); an unparseable phone number raises ValueError before any
+        password is hashed.
+        """
+        rows = [dict(row) for row in rows]
+        passwords = [row.pop("password") for row in rows]
+        for row in rows:
+            row["email"] = row["email"].lower()  # Match lower(email) index
+            if "phone_number" in row:
+                row["phone_number"] = normalize_phone_number(row["phone_number"])
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            hashed = list(executor.map(make_password, passwords))
+
+        users = [
+            cls(password=password_hash, **row)
+            for password_hash, row in zip(hashed, rows)
+        ]
+        return cls.objects.bulk_create(users, batch_size=batch_size)
+
     # Fat Models: Business logic methods
     def get_full_display_name(self):
         """Return display name with fallback."""
@@ -96,7 +207,10 @@ class User(AbstractUser):
 
     def is_experienced_designer(self):
         """Check if user has significant design experience."""
-        return self.years_of_experience and self.years_of_experience >= 3
+        return (
+            self.years_of_experience
+            and self.years_of_experience >= self.EXPERIENCED_DESIGNER_YEARS
+        )
 
     def get_portfolio_url(self):
         """Generate portfolio URL for this user."""
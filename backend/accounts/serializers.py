@@ -10,14 +10,23 @@ Guidelines: Security First - 모든 입력값을 검증해야 함
 """
 
 # Django 기본 라이브러리
-from django.contrib.auth import authenticate
+from django.db.models import BooleanField, Case, CharField, Value, When
+from django.db.models.functions import Coalesce, Concat, NullIf
+from django.utils import timezone
 
 # DRF (Django REST Framework) 라이브러리
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+
+# 프로젝트 공통 모듈
+from common.serializers import CachedFieldsMixin
 
 # 우리가 만든 User 모델 가져오기
-from .models import User
+from .models import User, normalize_phone_number
+from .utils import authenticate_cached, issue_tokens
+
+PHONE_NUMBER_ERROR = (
+    "올바른 전화번호 형식(예: 010-1234-5678 또는 +821012345678)을 입력해주세요."
+)
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -71,6 +80,29 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             "display_name": {"required": True},
         }
 
+    def validate_email(self, value):
+        """
+        이메일을 소문자로 정규화하여 저장
+
+        Why: lower(email) 유니크 인덱스와 일치시켜 대소문자만 다른 중복 가입을 막고,
+        로그인 시 정확 일치(=) 조회로 인덱스를 그대로 사용하기 위함
+        """
+        value = value.lower()
+        if User.objects.filter(email=value).exists():
+            raise serializers.ValidationError("이미 사용 중인 이메일입니다.")
+        return value
+
+    def validate_phone_number(self, value):
+        """
+        전화번호를 E.164 형식(+821012345678)으로 정규화
+
+        Why: 저장 형식을 하나로 통일하고, 형식 검증은 DB 제약조건(users_phone_e164)에 맡김
+        """
+        try:
+            return normalize_phone_number(value)
+        except ValueError:
+            raise serializers.ValidationError(PHONE_NUMBER_ERROR)
+
     def validate(self, attrs):
         """
         여러 필드를 함께 검증하는 메서드
@@ -85,12 +117,22 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             ValidationError: 검증 실패 시 발생
         """
         # 비밀번호와 비밀번호 확인이 일치하는지 검사
-        if attrs["password"] != attrs["password_confirm"]:
+        # password_confirm은 DB에 저장하지 않으므로 여기서 바로 제거
+        if attrs.get("password") != attrs.pop("password_confirm", None):
             raise serializers.ValidationError("비밀번호가 일치하지 않습니다.")
 
         # 검증된 데이터 반환
         return attrs
 
+    def to_representation(self, instance):
+        """
+        생성된 사용자를 프로필 형식으로 직렬화
+
+        Why: 회원가입 응답의 user 데이터를 serializer.data로 바로 사용
+        (뷰에서 UserProfileSerializer를 별도로 만들지 않음)
+        """
+        return UserProfileSerializer(instance, context=self.context).data
+
     # create() 메서드도 자동으로 제공됨 (필요시에만 오버라이드)
     def create(self, validated_data):
         """
@@ -104,9 +146,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
         Fat Models 원칙: 비즈니스 로직은 모델에서 처리
         """
-        # password_confirm은 DB에 저장하지 않으므로 제거
-        validated_data.pop("password_confirm")
-
         # 비밀번호를 별도로 추출 (해싱을 위해)
         password = validated_data.pop("password")
 
@@ -117,24 +156,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         )
         return user
 
-    # 만약 Serializer로 회원가입을 구현한다면:
-
-    # class UserRegistrationSerializer(serializers.Serializer):
-    # # 모든 필드를 수동으로 정의해야 함 (코드 중복)
-    # email = serializers.EmailField(required=True)
-    # username = serializers.CharField(max_length=150, required=True)
-    # display_name = serializers.CharField(max_length=50, required=True)
-    # bio = serializers.CharField(max_length=500, required=False, allow_blank=True)
-    # specialization = serializers.CharField(max_length=100, required=False, allow_blank=True)
-    # years_of_experience = serializers.IntegerField(required=False, allow_null=True)
-    # website = serializers.URLField(required=False, allow_blank=True)
-    # phone_number = serializers.CharField(max_length=17, required=False, allow_blank=True)
-    # # ... 모델과 동일한 내용을 또 써야 함 (DRY 원칙 위반)
-
-    # def create(self, validated_data):
-    #     # 생성 로직도 직접 구현해야 함
-    #     return User.objects.create_user(**validated_data)
-
 
 class UserLoginSerializer(serializers.Serializer):
     """
@@ -166,37 +187,38 @@ class UserLoginSerializer(serializers.Serializer):
 
         이 메서드에서 실제 로그인 검증을 수행함
         """
-        email = attrs.get("email")
+        # 가입 시와 동일하게 소문자로 정규화 (email 인덱스 정확 일치 조회)
+        email = (attrs.get("email") or "").lower()
         password = attrs.get("password")
 
         # 이메일과 비밀번호가 모두 있는지 확인
         if email and password:
-            # Django의 authenticate() 함수로 사용자 인증
+            # Django의 authenticate() 함수로 사용자 인증 (짧은 TTL 캐시 적용)
             # USERNAME_FIELD가 'email'로 설정되어 있지만
             # authenticate() 함수는 항상 'username' 파라미터를 사용함
-            user = authenticate(
-                request=self.context.get("request"),  # HTTP 요청 객체
-                username=email,  # 실제로는 이메일을 전달
-                password=password,
+            user = authenticate_cached(
+                self.context.get("request"),  # HTTP 요청 객체
+                email,
+                password,
             )
 
             # 인증 실패한 경우
+            # 비활성 계정도 여기에 포함됨 (ModelBackend.user_can_authenticate()가
+            # None을 반환하고, 캐시 적중 시에도 is_active=True 조건으로 조회)
             if not user:
                 raise serializers.ValidationError(
                     "이메일 또는 비밀번호가 잘못되었습니다."
                 )
 
-            # 계정이 비활성화된 경우
-            if not user.is_active:
-                raise serializers.ValidationError("비활성화된 계정입니다.")
-
-            # JWT 토큰 생성 (Stateless API 구현)
-            refresh = RefreshToken.for_user(user)
+            # JWT 토큰 생성 (Stateless API 구현) - 토큰별 서명은 한 번만 수행
+            tokens = issue_tokens(user)
 
             # 검증된 데이터에 사용자 정보와 토큰 추가
             attrs["user"] = user
-            attrs["refresh"] = str(refresh)  # 갱신 토큰 (긴 수명)
-            attrs["access"] = str(refresh.access_token)  # 접근 토큰 (짧은 수명)
+            # 응답용 프로필 데이터 (뷰에서 다시 직렬화하지 않도록 여기서 한 번만 생성)
+            attrs["user_data"] = UserProfileSerializer(user, context=self.context).data
+            attrs["refresh"] = tokens["refresh"]  # 갱신 토큰 (긴 수명)
+            attrs["access"] = tokens["access"]  # 접근 토큰 (짧은 수명)
 
         else:
             raise serializers.ValidationError("이메일과 비밀번호를 모두 입력해주세요.")
@@ -204,7 +226,7 @@ class UserLoginSerializer(serializers.Serializer):
         return attrs
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     사용자 프로필 조회/수정용 Serializer
 
@@ -227,17 +249,20 @@ class UserProfileSerializer(serializers.ModelSerializer):
     - 표준적인 CRUD 작업
     """
 
-    # 읽기 전용 필드들: 모델의 메서드 결과를 JSON에 포함
-    full_display_name = serializers.CharField(
-        source="get_full_display_name",  # User 모델의 get_full_display_name() 메서드 호출
-        read_only=True,  # 클라이언트에서 수정할 수 없음
-    )
+    # 읽기 전용 계산 필드들
+    # setup_eager_loading()의 annotation 값을 우선 사용 (DB에서 계산)
+    # annotation이 없으면 User 모델 메서드 결과를 사용
+    full_display_name = serializers.SerializerMethodField()
+
+    is_experienced_designer = serializers.SerializerMethodField()
 
-    is_experienced_designer = serializers.BooleanField(read_only=True)
+    portfolio_url = serializers.SerializerMethodField()
 
-    portfolio_url = serializers.CharField(
-        source="get_portfolio_url",  # User 모델의 get_portfolio_url() 메서드 호출
-        read_only=True,
+    # setup_eager_loading()이 추가하는 계산 필드 annotation 이름들
+    ANNOTATIONS = (
+        "annotated_full_display_name",
+        "experienced_designer_flag",
+        "annotated_portfolio_url",
     )
 
     class Meta:
@@ -263,15 +288,88 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "updated_at",  # 최종 수정일 (자동 업데이트)
         ]  # 사용할 필드만 선택
 
-        # 모델의 필드 정의를 자동으로 상속받음:
-        # 하지만 모델의 메서드를 직접 상속받지는 않음!
-
-        # email = models.EmailField() → serializers.EmailField() 자동 생성
-        # display_name = models.CharField(max_length=50) → serializers.CharField(max_length=50) 자동 생성
-
         # 클라이언트에서 수정할 수 없는 필드들
         read_only_fields = ["id", "email", "date_joined"]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        직렬화에 필요한 컬럼만 조회하도록 QuerySet 최적화
+
+        Why: 뷰의 get_queryset()에서 반드시 호출해야 함
+        - only()로 직렬화에 쓰이는 컬럼만 SELECT (password, last_login 등 제외)
+        - FK 필드가 추가되면 여기에 select_related/prefetch_related를 추가
+
+        Args:
+            queryset (QuerySet): User 쿼리셋
+
+        Returns:
+            QuerySet: 최적화된 User 쿼리셋
+        """
+        return queryset.annotate(
+            # Why: 계산 필드를 행마다 Python 메서드로 만들지 않고 SELECT에서 함께 계산
+            # get_full_display_name(): display_name이 비어 있으면 username
+            annotated_full_display_name=Coalesce(
+                NullIf("display_name", Value("")), "username"
+            ),
+            # is_experienced_designer(): 경력 연차 기준 (SQL CASE)
+            experienced_designer_flag=Case(
+                When(
+                    years_of_experience__gte=User.EXPERIENCED_DESIGNER_YEARS,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            # get_portfolio_url(): /portfolio/<username>/
+            annotated_portfolio_url=Concat(
+                Value("/portfolio/"), "username", Value("/"), output_field=CharField()
+            ),
+        ).only(
+            "id",
+            "email",
+            "username",
+            "display_name",
+            "bio",
+            "specialization",
+            "years_of_experience",
+            "website",
+            "phone_number",
+            "profile_image",
+            "is_portfolio_public",
+            "date_joined",
+            "updated_at",
+        )
+
+    def get_full_display_name(self, obj):
+        """전체 표시 이름 (annotation 우선, 없으면 모델 메서드)"""
+        name = getattr(obj, "annotated_full_display_name", None)
+        return name if name is not None else obj.get_full_display_name()
+
+    def get_portfolio_url(self, obj):
+        """포트폴리오 URL (annotation 우선, 없으면 모델 메서드)"""
+        url = getattr(obj, "annotated_portfolio_url", None)
+        return url if url is not None else obj.get_portfolio_url()
+
+    def get_is_experienced_designer(self, obj):
+        """
+        경험 많은 디자이너 여부
+
+        get_queryset()을 거친 객체는 annotation 값을 사용하고,
+        request.user처럼 annotation이 없는 객체는 모델 메서드로 계산
+        """
+        flag = getattr(obj, "experienced_designer_flag", None)
+        if flag is None:
+            flag = obj.is_experienced_designer()
+        return bool(flag)
+
+    def validate_phone_number(self, value):
+        """전화번호를 E.164 형식으로 정규화 (회원가입과 동일)"""
+        try:
+            return normalize_phone_number(value)
+        except ValueError:
+            raise serializers.ValidationError(PHONE_NUMBER_ERROR)
+
     def update(self, instance, validated_data):
         """
         사용자 프로필 업데이트
@@ -285,34 +383,35 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
         Guidelines: ORM 사용으로 SQL 인젝션 방지
         """
-        # 검증된 데이터로 필드들을 하나씩 업데이트
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)  # instance.attr = value와 같음
-
-            # items() → dict의 키-값 쌍을 튜플로 반환
-            # setattr() → 객체의 속성을 동적으로 설정
-
-            # Python 내장 함수 - 객체의 속성을 동적으로 설정
-            # user = User()
-
-            # # 일반적인 방법
-            # user.display_name = '김디자이너'
-
-            # # setattr()를 사용한 방법 (동적으로 속성명 지정 가능)
-            # setattr(user, 'display_name', '김디자이너')
-
-            # # 반복문에서 유용함
-            # for attr, value in validated_data.items():
-            #     setattr(user, attr, value)  # user.display_name = '김디자이너' 와 동일
+        # 실제로 값이 바뀐 필드만 추려냄 (변경 없는 컬럼은 UPDATE 대상에서 제외)
+        changed = {
+            attr: value
+            for attr, value in validated_data.items()
+            if getattr(instance, attr) != value
+        }
 
-        # DB에 저장 (updated_at 필드가 자동으로 갱신됨)
-        instance.save()
+        if not changed:
+            return instance
+
+        # Why: annotation 값은 수정 전 컬럼 기준이므로 제거하여 응답에서 모델 메서드로 다시 계산
+        for name in self.ANNOTATIONS:
+            instance.__dict__.pop(name, None)
+
+        # 이미지 파일은 storage 저장이 필요하므로 모델 save() 경로를 사용
+        # Why: QuerySet.update()는 FileField의 pre_save(파일 저장)를 호출하지 않음
+        if "profile_image" in changed:
+            for attr, value in changed.items():
+                setattr(instance, attr, value)
+            # 변경된 컬럼만 SET 절에 포함 (updated_at은 auto_now로 갱신)
+            instance.save(update_fields=[*changed, "updated_at"])
+            return instance
+
+        # Why: save()는 모든 컬럼을 UPDATE하므로 변경된 컬럼만 단일 UPDATE로 반영
+        # auto_now는 QuerySet.update()에서 동작하지 않으므로 updated_at을 직접 지정
+        changed["updated_at"] = timezone.now()
+        User.objects.filter(pk=instance.pk).update(**changed)
+
+        # 방금 기록한 값으로 인스턴스 동기화 (응답 직렬화에 사용, 다시 SELECT 하지 않음)
+        for attr, value in changed.items():
+            setattr(instance, attr, value)
         return instance
-
-        # save()
-        # Django Model의 메서드 (User 모델이 상속받은 기능)
-        # Django가 자동으로 제공하는 메서드들:
-
-        # - save(): 객체를 데이터베이스에 저장
-        # - delete(): 객체를 데이터베이스에서 삭제
-        # - refresh_from_db(): 데이터베이스에서 최신 데이터로 새로고침
@@ -1,3 +1,170 @@
+from unittest import mock
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch, get_md5_hash_password
+
+from .authentication import CachedJWTAuthentication
+from .models import User
+from .utils import issue_tokens, issue_tokens_bulk
+
+
+class IssueTokensTests(TestCase):
+    """
+    Why: issue_tokens_bulk는 JWT를 직접 조립/서명하므로
+    simplejwt가 그대로 검증하고 RefreshToken.for_user()와 같은 claim/발급 이력을 남기는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                display_name=f"User {i}",
+                password="pw123456!!",
+            )
+            for i in range(3)
+        ]
+
+    def assertTokenPair(self, tokens, user):
+        refresh = token_backend.decode(tokens["refresh"], verify=True)
+        access = token_backend.decode(tokens["access"], verify=True)
+
+        self.assertEqual(refresh[api_settings.TOKEN_TYPE_CLAIM], "refresh")
+        self.assertEqual(access[api_settings.TOKEN_TYPE_CLAIM], "access")
+        for payload in (refresh, access):
+            self.assertEqual(payload[api_settings.USER_ID_CLAIM], str(user.pk))
+            if api_settings.CHECK_REVOKE_TOKEN:
+                self.assertEqual(
+                    payload[api_settings.REVOKE_TOKEN_CLAIM],
+                    get_md5_hash_password(user.password),
+                )
+        self.assertNotEqual(
+            refresh[api_settings.JTI_CLAIM], access[api_settings.JTI_CLAIM]
+        )
+        self.assertEqual(
+            refresh["exp"] - refresh["iat"],
+            api_settings.REFRESH_TOKEN_LIFETIME.total_seconds(),
+        )
+        self.assertEqual(
+            access["exp"] - access["iat"],
+            api_settings.ACCESS_TOKEN_LIFETIME.total_seconds(),
+        )
+
+        # simplejwt 토큰 클래스로도 그대로 검증되어야 함 (블랙리스트 확인 포함)
+        RefreshToken(tokens["refresh"])
+        AccessToken(tokens["access"])
+        return refresh
+
+    def assertOutstanding(self, token, payload, user):
+        outstanding = OutstandingToken.objects.get(jti=payload[api_settings.JTI_CLAIM])
+        self.assertEqual(outstanding.user_id, user.pk)
+        self.assertEqual(outstanding.token, token)
+        self.assertEqual(outstanding.expires_at, datetime_from_epoch(payload["exp"]))
+
+    def test_issue_tokens(self):
+        user = self.users[0]
+
+        tokens = issue_tokens(user)
+
+        refresh = self.assertTokenPair(tokens, user)
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertOutstanding(tokens["refresh"], refresh, user)
+
+    def test_issue_tokens_bulk_keeps_user_order(self):
+        issued = issue_tokens_bulk(self.users)
+
+        self.assertEqual(len(issued), len(self.users))
+        self.assertEqual(OutstandingToken.objects.count(), len(self.users))
+        jtis = set()
+        for tokens, user in zip(issued, self.users):
+            refresh = self.assertTokenPair(tokens, user)
+            self.assertOutstanding(tokens["refresh"], refresh, user)
+            jtis.add(refresh[api_settings.JTI_CLAIM])
+        self.assertEqual(len(jtis), len(self.users))
+
+    def test_issued_refresh_token_can_be_blacklisted(self):
+        tokens = issue_tokens(self.users[0])
+
+        RefreshToken(tokens["refresh"]).blacklist()
+
+        with self.assertRaises(TokenError):
+            RefreshToken(tokens["refresh"])
+
+    def test_authenticated_user_defers_profile_columns(self):
+        user = self.users[0]
+        access = AccessToken(issue_tokens(user)["access"])
+
+        with self.assertNumQueries(1):
+            authenticated = CachedJWTAuthentication().get_user(access)
+
+        self.assertEqual(authenticated.pk, user.pk)
+        self.assertEqual(authenticated.get_deferred_fields(), {"bio", "profile_image"})
+
+
+class UserProfileViewTests(TestCase):
+    """
+    Why: 계산 필드는 get_queryset()의 annotation으로 한 번의 SELECT에서 만들어져야 하며
+    행마다 User 모델 메서드를 호출하지 않아야 함
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="designer@example.com",
+            username="designer",
+            display_name="",
+            password="pw123456!!",
+            years_of_experience=5,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        # request.user를 직접 지정하여 인증 조회 없이 프로필 조회 쿼리만 측정
+        self.client.force_authenticate(self.user)
+
+    def assertComputedFromQuery(self, url):
+        with (
+            mock.patch.object(User, "get_full_display_name") as get_full_display_name,
+            mock.patch.object(User, "get_portfolio_url") as get_portfolio_url,
+        ):
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+
+        get_full_display_name.assert_not_called()
+        get_portfolio_url.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_list_computes_fields_in_query(self):
+        data = self.assertComputedFromQuery("/api/users/")
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["full_display_name"], "designer")
+        self.assertEqual(data[0]["portfolio_url"], "/portfolio/designer/")
+
+    def test_retrieve_computes_fields_in_query(self):
+        data = self.assertComputedFromQuery(f"/api/users/{self.user.pk}/")
+
+        self.assertEqual(data["id"], self.user.pk)
+        self.assertEqual(data["full_display_name"], "designer")
+        self.assertEqual(data["portfolio_url"], "/portfolio/designer/")
+
+    def test_experienced_designer_flag_computed_in_query(self):
+        for years, expected in ((User.EXPERIENCED_DESIGNER_YEARS, True), (1, False)):
+            User.objects.filter(pk=self.user.pk).update(years_of_experience=years)
+            with self.subTest(years_of_experience=years):
+                with mock.patch.object(
+                    User, "is_experienced_designer"
+                ) as is_experienced_designer:
+                    with self.assertNumQueries(1):
+                        response = self.client.get(f"/api/users/{self.user.pk}/")
 
-# Create your tests here.
+                is_experienced_designer.assert_not_called()
+                self.assertIs(response.json()["is_experienced_designer"], expected)
@@ -0,0 +1,241 @@
+"""
+인증 및 JWT 토큰 발급 유틸리티
+Why: 회원가입/로그인/로그아웃에서 공통으로 쓰는 인증 로직을 한 곳에서 관리
+"""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import jwt
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
+from django.db import close_old_connections
+from jwt.utils import base64url_encode
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch, get_md5_hash_password
+
+BLACKLIST_ENABLED = (
+    "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS
+)
+
+# 로그인 결과 캐시 유지 시간 (초) - 짧게 유지하여 재인증 폭주 시에만 효과
+AUTH_CACHE_TIMEOUT = 60
+
+logger = logging.getLogger(__name__)
+
+# 응답과 무관한 DB 쓰기(토큰 블랙리스트 등)를 처리하는 백그라운드 스레드
+_background_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="accounts-bg"
+)
+
+
+def _auth_cache_key(email: str, password: str) -> str:
+    """
+    이메일+비밀번호 조합의 캐시 키
+
+    Why: 평문 비밀번호를 캐시에 남기지 않도록 SECRET_KEY로 키를 건 blake2b 다이제스트 사용
+    """
+    digest = hashlib.blake2b(
+        f"{email}\0{password}".encode(),
+        digest_size=16,
+        key=settings.SECRET_KEY.encode()[:64],  # blake2b 키 최대 64바이트
+    ).hexdigest()
+    return f"auth:{digest}"
+
+
+def authenticate_cached(request, email: str, password: str):
+    """
+    짧은 TTL 캐시를 둔 authenticate()
+
+    Why: 같은 자격 증명으로 반복 로그인할 때 비밀번호 해시 검증(수십 ms)을 생략
+    - 캐시에는 (user_id, 인증 당시 비밀번호 해시의 다이제스트)만 저장
+      (Argon2 해시 원문은 캐시에 남기지 않음)
+    - 적중 시에도 활성 사용자인지, 비밀번호 해시가 그대로인지 DB에서 확인하므로
+      비밀번호 변경/계정 비활성화는 즉시 반영됨
+
+    Args:
+        request: HTTP 요청 객체 (authenticate()에 전달)
+        email (str): 정규화된(소문자) 이메일
+        password (str): 입력된 비밀번호
+
+    Returns:
+        User | None: 인증된 사용자 또는 None
+    """
+    key = _auth_cache_key(email, password)
+    cached = cache.get(key)
+    if cached is not None:
+        user_id, password_digest = cached
+        user = get_user_model().objects.filter(pk=user_id, is_active=True).first()
+        if user is not None and get_md5_hash_password(user.password) == password_digest:
+            return user
+        cache.delete(key)
+
+    user = authenticate(request=request, username=email, password=password)
+    if user is not None:
+        # 로그아웃 시 무효화할 수 있도록 사용자별 역참조 키도 함께 저장
+        cache.set_many(
+            {
+                key: (user.pk, get_md5_hash_password(user.password)),
+                f"auth-key:{user.pk}": key,
+            },
+            AUTH_CACHE_TIMEOUT,
+        )
+    return user
+
+
+def forget_cached_auth(user_id: Optional[str]) -> None:
+    """
+    사용자의 로그인 캐시 무효화 (로그아웃 시 호출)
+    """
+    if user_id is None:
+        return
+    key = cache.get(f"auth-key:{user_id}")
+    if key is not None:
+        cache.delete_many([key, f"auth-key:{user_id}"])
+
+
+def _blacklist_token(token) -> None:
+    """백그라운드 스레드에서 refresh 토큰 블랙리스트 저장"""
+    # Why: 요청 밖의 스레드는 request_finished 신호를 받지 않으므로 커넥션 수명을 직접 관리
+    close_old_connections()
+    try:
+        # blacklist()는 get_or_create를 사용하므로 중복 호출되어도 안전
+        token.blacklist()
+    except Exception:
+        logger.exception("refresh 토큰 블랙리스트 저장 실패")
+    finally:
+        close_old_connections()
+
+
+def blacklist_in_background(token) -> None:
+    """
+    검증이 끝난 refresh 토큰의 블랙리스트 INSERT를 응답 이후로 미룸
+
+    Why: 클라이언트는 이미 토큰을 폐기했으므로 로그아웃 응답이 DB 쓰기를 기다릴 필요 없음
+    (서명/만료/기존 블랙리스트 검사는 RefreshToken 생성 시 요청 스레드에서 완료)
+
+    Args:
+        token (RefreshToken): 검증된 refresh 토큰
+    """
+    _background_executor.submit(_blacklist_token, token)
+
+
+def _b64_json(data, json_encoder=None) -> str:
+    """JSON 직렬화 후 base64url 인코딩 (JWT 세그먼트 형식)"""
+    return base64url_encode(
+        json.dumps(data, separators=(",", ":"), cls=json_encoder).encode()
+    ).decode()
+
+
+@lru_cache(maxsize=1)
+def _get_token_signer():
+    """
+    JWT 서명에 필요한 불변 객체를 프로세스당 한 번만 준비
+
+    Why: 알고리즘 객체 조회, 서명 키 준비, 헤더 세그먼트 인코딩은
+    SIMPLE_JWT 설정이 바뀌지 않는 한 항상 같은 결과
+    (token_backend는 simplejwt가 모듈 단위로 유지하는 TokenBackend 인스턴스)
+
+    Returns:
+        tuple: (알고리즘 객체, 준비된 서명 키, base64url 헤더 세그먼트)
+    """
+    algorithm = jwt.PyJWS().get_algorithm_by_name(token_backend.algorithm)
+    header = _b64_json({"alg": token_backend.algorithm, "typ": "JWT"})
+    return algorithm, token_backend.prepared_signing_key, header
+
+
+def issue_tokens_bulk(users) -> List[Dict[str, str]]:
+    """
+    여러 사용자에 대한 refresh/access 토큰 쌍을 한 번에 발급
+
+    Why: 토큰마다 반복되는 작업을 배치 바깥으로 분리
+    - 헤더 세그먼트 인코딩과 서명 알고리즘/키 준비는 프로세스당 한 번만 수행
+    - 토큰마다 payload 직렬화 + 서명을 정확히 한 번만 수행
+      (RefreshToken.for_user()는 OutstandingToken 저장 시 한 번,
+       str() 호출 시 또 한 번 서명함)
+    - OutstandingToken은 bulk_create로 한 번에 저장
+
+    Args:
+        users (Iterable[User]): 토큰을 발급할 사용자들
+
+    Returns:
+        list: [{"refresh": str, "access": str}, ...] (users 순서와 동일)
+    """
+    algorithm, signing_key, header = _get_token_signer()
+
+    def encode(payload) -> str:
+        claims = payload.copy()
+        if token_backend.audience is not None:
+            claims["aud"] = token_backend.audience
+        if token_backend.issuer is not None:
+            claims["iss"] = token_backend.issuer
+
+        signing_input = f"{header}.{_b64_json(claims, token_backend.json_encoder)}"
+        signature = algorithm.sign(signing_input.encode(), signing_key)
+        return f"{signing_input}.{base64url_encode(signature).decode()}"
+
+    issued = []
+    outstanding = []
+    for user in users:
+        # RefreshToken.for_user()와 동일한 claim 구성 (OutstandingToken 저장은 아래에서 일괄 처리)
+        refresh = RefreshToken()
+        refresh[api_settings.USER_ID_CLAIM] = str(
+            getattr(user, api_settings.USER_ID_FIELD)
+        )
+        if api_settings.CHECK_REVOKE_TOKEN:
+            refresh[api_settings.REVOKE_TOKEN_CLAIM] = get_md5_hash_password(
+                user.password
+            )
+
+        refresh_token = encode(refresh.payload)
+        issued.append(
+            {
+                "refresh": refresh_token,  # 갱신 토큰 (긴 수명)
+                "access": encode(refresh.access_token.payload),  # 접근 토큰 (짧은 수명)
+            }
+        )
+
+        if BLACKLIST_ENABLED:
+            outstanding.append((user, refresh, refresh_token))
+
+    if outstanding:
+        # Why: 로그아웃 시 blacklist()가 참조하는 발급 이력을 한 번의 INSERT로 저장
+        OutstandingToken.objects.bulk_create(
+            [
+                OutstandingToken(
+                    user=user,
+                    jti=refresh[api_settings.JTI_CLAIM],
+                    token=refresh_token,
+                    created_at=refresh.current_time,
+                    expires_at=datetime_from_epoch(refresh["exp"]),
+                )
+                for user, refresh, refresh_token in outstanding
+            ]
+        )
+
+    return issued
+
+
+def issue_tokens(user) -> Dict[str, str]:
+    """
+    사용자에 대한 refresh/access 토큰 쌍 발급
+
+    Why: 토큰마다 JSON 직렬화 + 서명을 정확히 한 번만 수행
+    - access 토큰은 refresh 토큰의 payload에서 파생
+    - 인코딩된 문자열을 반환하므로 호출부에서 str()을 반복 호출하지 않음
+
+    Args:
+        user (User): 토큰을 발급할 사용자
+
+    Returns:
+        dict: {"refresh": str, "access": str}
+    """
+    return issue_tokens_bulk([user])[0]
@@ -22,7 +22,11 @@
 
 # Django 기본 라이브러리
 from typing import Any, Dict, cast
+import orjson
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
 
 # DRF (Django REST Framework) 라이브러리
 from rest_framework import status, viewsets
@@ -30,9 +34,12 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.exceptions import PermissionDenied
 
+# 프로젝트 공통 모듈
+from common.mixins import AutoPrefetchMixin
 
 # 우리가 만든 Serializer들 가져오기
 from .serializers import (
@@ -41,7 +48,9 @@ from .serializers import (
     UserRegistrationSerializer,
 )
 
+from .authentication import forget_cached_token
 from .models import User
+from .utils import blacklist_in_background, forget_cached_auth, issue_tokens
 
 # User 모델 가져오기 (import 위치 최적화)
 UserModel = get_user_model()
@@ -49,6 +58,9 @@ UserModel = get_user_model()
 # get_user_model() 함수는 어떤 함수?
 # -> Django의 인증 시스템에서 현재 활성화된 User 모델을 반환하는 함수
 
+# /me/ 프로필 JSON 캐시 유지 시간 (초)
+PROFILE_CACHE_TIMEOUT = 5 * 60
+
 
 class AuthViewSet(viewsets.GenericViewSet):
     """
@@ -105,29 +117,20 @@ class AuthViewSet(viewsets.GenericViewSet):
             user = cast(User, serializer.save())  # 내부적으로 serializer.create() 호출
 
             # 4. 회원가입 시 로그인 토큰 생성 (추후 변경 가능)
-            refresh = RefreshToken.for_user(user)
-            # user에 빨간 밑줄.
-            # "Unknown | list[Unknown] | Any" 형식의 인수를 "for_user" 함수에서 "AuthUser@for_user" 형식의 "user" 매개 변수에 할당할 수 없습니다.
-            # 형식 "Unknown | list[Unknown] | Any"을 제한된 형식 변수 "AuthUser"에 할당할 수 없습니다.PylancereportArgumentType
-            # (variable) user: Unknown | list[Unknown] | Any
-
-            # 5. 사용자 프로필 데이터 준비
-            user_data = UserProfileSerializer(user).data
+            tokens = issue_tokens(user)
 
-            #  6. 성공 응답 반환
+            #  5. 성공 응답 반환
+            # serializer.data는 to_representation()에서 프로필 형식으로 한 번만 직렬화됨
             return Response(
                 {
-                    "user": user_data,
-                    "tokens": {
-                        "refresh": str(refresh),
-                        "access": str(refresh.access_token),
-                    },
+                    "user": serializer.data,
+                    "tokens": tokens,
                     "message": "회원가입이 성공적으로 완료되었습니다.",
                 },
                 status=status.HTTP_201_CREATED,
             )
 
-        # 7. 검증 실패 시 에러 응답
+        # 6. 검증 실패 시 에러 응답
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=["post"])
@@ -155,21 +158,14 @@ class AuthViewSet(viewsets.GenericViewSet):
             # 타입 체킹 우회
             validated_data = serializer.validated_data  # type: ignore
 
-            # 3. 검증된 사용자 정보 추출
-            user = cast(User, validated_data["user"])  # type: ignore
-            refresh_token = str(validated_data["refresh"])  # type: ignore
-            access_token = str(validated_data["access"])  # type: ignore
-
-            # 4. 사용자 프로필 데이터 준비
-            user_data = UserProfileSerializer(user).data
-
-            # 5. 성공 응답 반환 (JWT 토큰 포함)
+            # 3. 성공 응답 반환 (JWT 토큰 포함)
+            # 프로필 데이터와 토큰은 validate()에서 한 번만 만들어짐
             return Response(
                 {
-                    "user": user_data,
+                    "user": validated_data["user_data"],  # type: ignore
                     "tokens": {
-                        "refresh": refresh_token,
-                        "access": access_token,
+                        "refresh": validated_data["refresh"],  # type: ignore
+                        "access": validated_data["access"],  # type: ignore
                         # serializer.validated_data 에 빨간 밑줄.
                         # "__getitem__" 메서드가 "empty" 형식에 정의되지 않았습니다.PylancereportIndexIssue
                         # ’None’ 유형의 개체는 아래 첨자를 사용할 수 없습니다.PylancereportOptionalSubscript
@@ -179,7 +175,7 @@ class AuthViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_200_OK,
             )
 
-        # 6. 인증 실패 시 에러 응답
+        # 4. 인증 실패 시 에러 응답
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=["post"])
@@ -201,7 +197,12 @@ class AuthViewSet(viewsets.GenericViewSet):
 
             # 2. 토큰 객체 생성 및 블랙리스트 추가
             token = RefreshToken(refresh_token)
-            token.blacklist()  # django-rest-framework-simplejwt의 토큰 무효화 처리
+            forget_cached_token(request.auth)  # access 토큰 검증 캐시 먼저 무효화
+            # django-rest-framework-simplejwt의 토큰 무효화 처리 (DB 저장은 백그라운드)
+            blacklist_in_background(token)
+            forget_cached_auth(
+                token.get(api_settings.USER_ID_CLAIM)
+            )  # 로그인 캐시도 함께 무효화
 
             # 3. 성공 응답 반환
             return Response(
@@ -265,7 +266,7 @@ class AuthViewSet(viewsets.GenericViewSet):
             )
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
+class UserProfileViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """
     사용자 프로필 관리를 위한 ViewSet
 
@@ -285,6 +286,10 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     4. 향후 공개 프로필 기능 시 권한 로직 확장 예정
     """
 
+    # 기본 QuerySet (get_queryset()에서 현재 사용자로 좁힘)
+    # Why: AutoPrefetchMixin이 super().get_queryset()으로 관계 필드를 자동 로드
+    queryset = User.objects.filter(is_active=True)
+
     # 이 ViewSet에서 사용할 Serializer 지정
     serializer_class = UserProfileSerializer
 
@@ -305,7 +310,8 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         이 ViewSet에서 사용할 QuerySet 정의
 
         QuerySet 최적화:
-        - N+1 문제 방지를 위한 select_related 사용
+        - N+1 문제 방지: Serializer가 참조하는 관계만 AutoPrefetchMixin이 로드
+          (인자 없는 select_related()는 모든 non-null FK를 JOIN하므로 사용하지 않음)
         - 비활성 사용자 제외
 
         Guidelines: 성능 최적화를 위한 쿼리 최적화
@@ -313,9 +319,10 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         Returns:
             QuerySet: 최적화된 User 쿼리셋
         """
-        return User.objects.select_related().filter(
-            is_active=True, id=self.request.user.pk  # 현재 사용자 프로필만 조회 가능
-        )
+        # 현재 사용자 프로필만 조회 가능
+        queryset = super().get_queryset().filter(id=self.request.user.pk)
+        # Serializer가 필요한 컬럼/관계만 조회하도록 위임
+        return UserProfileSerializer.setup_eager_loading(queryset)
 
         # N+1 문제란?
         #  - 데이터베이스에서 관련된 객체를 반복적으로 조회하는 비효율적인 쿼리 패턴
@@ -330,12 +337,18 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         현재 요청한 사용자의 프로필 반환
 
         일반적으로는 URL에서 ID를 추출하지만,
-        현재 사용자 프로필의 경우 JWT 토큰에서 사용자 추출
+        현재 사용자 프로필의 경우 JWT 토큰의 사용자로 좁힌 get_queryset()에서 조회
+
+        Why: request.user는 인증용으로 조회한 객체라 계산 필드 annotation이 없음
+        - get_queryset()을 거쳐야 setup_eager_loading()의 only()/annotation이
+          한 번의 SELECT로 적용됨
 
         Returns:
             User: 현재 인증된 사용자 객체
         """
-        return self.request.user
+        user = get_object_or_404(self.get_queryset())
+        self.check_object_permissions(self.request, user)
+        return user
 
     def list(self, request):
         """
@@ -347,9 +360,9 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         자신의 프로필만 조회 가능하도록 제한되어 있음.
         향후 관리자 기능 추가 시 권한 로직 확장 예정.
         """
-        # 현재 정책: 본인 정보만 포함된 리스트 반환
-        user_data = UserProfileSerializer(request.user).data
-        return Response([user_data])
+        # 현재 정책: 본인 정보만 포함된 리스트 반환 (get_queryset()이 본인으로 좁힘)
+        serializer = self.get_serializer(self.get_queryset(), many=True)
+        return Response(serializer.data)
 
     @action(detail=False, methods=["get", "put", "patch"])
     def me(self, request):
@@ -367,12 +380,29 @@ class UserProfileViewSet(viewsets.ModelViewSet):
 
         # GET 요청: 프로필 조회
         if request.method == "GET":
-            serializer = self.get_serializer(user)
+            # 렌더링된 JSON 캐시 확인
+            # Why: 프로필은 자주 바뀌지 않으므로 updated_at을 키에 넣어 직렬화/렌더링 생략
+            # 프로필이 수정되면 updated_at이 바뀌어 새 키를 사용하게 됨
+            # (request.user는 매 요청 DB에서 읽으므로 다른 워커에서 수정해도 즉시 새 키 사용)
+            # (이미지 URL이 요청 scheme/호스트 기준 절대 경로이므로 둘 다 키에 포함)
+            cache_key = "uprof:{}:{}:{}://{}".format(
+                user.pk,
+                int(user.updated_at.timestamp() * 1_000_000),
+                request.scheme,
+                request.get_host(),
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return HttpResponse(cached, content_type="application/json")
+
+            serializer = self.get_serializer(self.get_object())
             # get_serializer() 메서드는 어디에서 왔으며, 어떤 역할을 하나?
             # - Django REST Framework의 GenericAPIView에서 제공하는 메서드
             # - 주어진 객체(user)를 직렬화하여 JSON 형태로 변환
 
-            return Response(serializer.data)
+            content = orjson.dumps(serializer.data)
+            cache.set(cache_key, content, PROFILE_CACHE_TIMEOUT)
+            return HttpResponse(content, content_type="application/json")
 
         # PUT/PATCH 요청: 프로필 수정
         elif request.method in ["PUT", "PATCH"]:
@@ -380,7 +410,7 @@ class UserProfileViewSet(viewsets.ModelViewSet):
             partial = request.method == "PATCH"
 
             serializer = self.get_serializer(
-                user,  # 수정할 사용자 객체
+                self.get_object(),  # 수정할 사용자 객체
                 data=request.data,  # 클라이언트에서 보낸 새로운 데이터
                 partial=partial,  # 부분 수정 여부
             )
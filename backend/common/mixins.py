@@ -0,0 +1,102 @@
+"""
+ViewSet 공통 믹스인
+Why: 여러 앱의 ViewSet에서 재사용하는 QuerySet 최적화 로직
+"""
+
+from functools import lru_cache
+from typing import Set, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def _collect_related_paths(
+    fields, model, prefix: str, many: bool, select: Set[str], prefetch: Set[str]
+) -> None:
+    """
+    Serializer 필드의 source 경로 중 관계(FK/1:1/M2M/역참조)를 지나는 부분을 수집
+
+    - FK/1:1만 지나는 경로 → select_related (JOIN)
+    - M2M/역참조를 한 번이라도 지나는 경로 → prefetch_related (별도 쿼리)
+    """
+    for field in fields.values():
+        # SerializerMethodField 등 객체 전체를 넘기는 필드는 추적 불가
+        if field.source == "*":
+            continue
+
+        current_model = model
+        path = []
+        path_many = many
+        for attr in field.source.split("."):
+            try:
+                model_field = current_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break  # 모델 메서드/프로퍼티 → 더 이상 관계를 따라갈 수 없음
+            if not model_field.is_relation:
+                break
+            path.append(attr)
+            path_many = path_many or model_field.many_to_many or model_field.one_to_many
+            current_model = model_field.related_model
+
+        if not path:
+            continue
+
+        full_path = prefix + "__".join(path)
+        (prefetch if path_many else select).add(full_path)
+
+        # 중첩 Serializer는 관계 모델 기준으로 재귀 탐색
+        child = getattr(field, "child", field)
+        if isinstance(child, serializers.BaseSerializer):
+            _collect_related_paths(
+                child.fields,
+                current_model,
+                full_path + "__",
+                path_many,
+                select,
+                prefetch,
+            )
+
+
+@lru_cache(maxsize=None)
+def get_related_paths(serializer_class) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Serializer 클래스에서 select_related / prefetch_related 대상 경로 추출
+
+    Why: Serializer 정의는 런타임에 바뀌지 않으므로 클래스별로 한 번만 계산
+
+    Returns:
+        tuple: (select_related 경로들, prefetch_related 경로들)
+    """
+    select: Set[str] = set()
+    prefetch: Set[str] = set()
+    _collect_related_paths(
+        serializer_class().fields,
+        serializer_class.Meta.model,
+        "",
+        False,
+        select,
+        prefetch,
+    )
+    # prefetch 경로에 포함된 FK 경로는 prefetch 쪽에서 함께 로드됨
+    return tuple(sorted(select)), tuple(sorted(prefetch))
+
+
+class AutoPrefetchMixin:
+    """
+    Serializer의 source 경로를 분석하여 관계 필드를 자동으로 미리 로드하는 믹스인
+
+    Why: 새 FK/M2M 필드를 Serializer에 추가해도 get_queryset()을 잊지 않고
+    수정할 필요 없이 N+1 쿼리를 방지
+
+    사용법: ViewSet 기반 클래스 앞에 두고, get_queryset()에서 super()를 호출
+        class MyViewSet(AutoPrefetchMixin, viewsets.ModelViewSet): ...
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select, prefetch = get_related_paths(self.get_serializer_class())
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
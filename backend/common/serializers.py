@@ -0,0 +1,28 @@
+"""
+Serializer 공통 믹스인
+Why: 여러 앱의 Serializer에서 재사용하는 성능 최적화 로직
+"""
+
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    ModelSerializer의 필드 구성을 클래스별로 한 번만 계산하는 믹스인
+
+    Why: ModelSerializer.get_fields()는 인스턴스를 만들 때마다 모델 메타 정보를
+    다시 분석하고 Meta.fields 목록을 순회하며 필드 객체를 새로 만듦
+    - 첫 호출 결과를 클래스에 저장하고, 이후에는 deepcopy만 수행
+    - Field.__deepcopy__는 생성 인자로 새 필드를 만들 뿐이므로 인스턴스 간 상태는 공유되지 않음
+
+    주의: get_fields()가 요청/context에 따라 다른 필드를 반환하는 Serializer에는 사용 금지
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # 하위 클래스가 부모의 캐시를 재사용하지 않도록 cls.__dict__에서 확인
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
@@ -80,6 +80,12 @@ try:
 except Exception as e:
     raise Exception(f"NCP 환경변수 설정 오류: {str(e)}")
 
+# Why: complete_upload의 파트 목록은 기본적으로 경량 검증 함수로 한 번에 검사
+# 필드별 상세 오류 메시지가 필요할 때(디버깅/감사)만 DRF 시리얼라이저 검증을 함께 수행
+MAIU_STRICT_PART_VALIDATION = config(
+    "MAIU_STRICT_PART_VALIDATION", default=False, cast=bool
+)
+
 
 ROOT_URLCONF = "config.urls"
 
@@ -110,6 +116,14 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD"),
         "HOST": config("DB_HOST"),
         "PORT": config("DB_PORT"),
+        # 커넥션 재사용 (요청마다 TCP 연결/인증 핸드셰이크를 반복하지 않음)
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=int),
+        # 재사용 전 연결 상태 확인 (DB 재시작 후 끊긴 커넥션으로 인한 오류 방지)
+        "CONN_HEALTH_CHECKS": True,
+        # pgbouncer transaction pooling 사용 시 True (서버 측 커서 비활성화)
+        "DISABLE_SERVER_SIDE_CURSORS": config(
+            "DB_DISABLE_SERVER_SIDE_CURSORS", default=False, cast=bool
+        ),
         "OPTIONS": {
             # PostgreSQL 전용 UTF-8 인코딩 설정
             "client_encoding": "UTF8",
@@ -139,16 +153,35 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing - Argon2 우선 사용 (argon2-cffi 필요)
+# Why: PBKDF2의 반복 SHA256 대비 같은 보안 수준에서 검증 비용이 낮음
+# 기존 PBKDF2 해시는 다음 로그인 성공 시 Argon2로 자동 재해싱됨
+# Argon2 파라미터는 accounts/hashers.py 참고 (OWASP 권장값)
+PASSWORD_HASHERS = [
+    "accounts.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 # Django REST Framework - JWT 기반 Stateless API 구현 (Guidelines 준수)
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 검증 결과를 짧게 캐시하는 JWTAuthentication
+        "accounts.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        # orjson 기반 JSON 렌더러 (C 구현, 표준 json 모듈보다 빠름)
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        # orjson 기반 JSON 파서 (대량 파트 목록 등 큰 요청 본문의 파싱 비용 절감)
+        "drf_orjson_renderer.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
@@ -0,0 +1,19 @@
+"""
+유실된 업로드 조합 작업 복구 명령
+Why: 서버 재시작 등으로 백그라운드 조합 작업이 사라진 업로드를 주기적으로(cron) 다시 조합
+"""
+
+from django.core.management.base import BaseCommand
+
+from maiu.services.ncp_storage import MaiuNCPStorageService
+from maiu.services.upload_finalize import FINALIZE_STALE_AFTER, recover_stale_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        f'{FINALIZE_STALE_AFTER} 이상 "processing"으로 남은 업로드를 다시 조합합니다.'
+    )
+
+    def handle(self, *args, **options):
+        recovered = recover_stale_uploads(MaiuNCPStorageService())
+        self.stdout.write(f"다시 조합한 업로드: {recovered}건")
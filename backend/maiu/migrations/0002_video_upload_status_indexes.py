@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maiu", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="videoupload",
+            index=models.Index(
+                fields=["uploader", "status", "-created_at"],
+                name="maiu_up_stat_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videoupload",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["pending", "uploading", "processing"])
+                ),
+                fields=["uploader", "-created_at"],
+                name="maiu_active_uploads_idx",
+            ),
+        ),
+    ]
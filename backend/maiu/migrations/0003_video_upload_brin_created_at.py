@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:29
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maiu", "0002_video_upload_status_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="videoupload",
+            name="maiu_video__visibil_424c5a_idx",
+        ),
+        migrations.AddIndex(
+            model_name="videoupload",
+            index=models.Index(
+                condition=models.Q(("visibility", "public")),
+                fields=["-created_at"],
+                name="maiu_public_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videoupload",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="maiu_created_brin_idx", pages_per_range=32
+            ),
+        ),
+    ]
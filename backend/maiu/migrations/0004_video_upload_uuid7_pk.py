@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-15 06:29
+
+import maiu.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maiu", "0003_video_upload_brin_created_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="videoupload",
+            name="id",
+            field=models.UUIDField(
+                default=maiu.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -6,10 +6,26 @@ Why: settings.AUTH_USER_MODEL을 사용하여 커스텀 User 모델과 연결
 
 from django.db import models
 from django.conf import settings  # Why: settings.AUTH_USER_MODEL 사용을 위해 import
+from django.contrib.postgres.indexes import BrinIndex
 from django.core.validators import FileExtensionValidator
+import os
+import time
 import uuid
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Why: 시간 순으로 증가하는 UUIDv7 (RFC 9562) 생성
+    Why: uuid4는 무작위 값이라 PK B-tree의 임의 위치에 삽입되지만,
+         UUIDv7은 앞 48비트가 밀리초 타임스탬프여서 새 행이 인덱스 끝에 모임
+    구조: 48비트 unix_ts_ms | 4비트 버전(7) | 12비트 난수 | 2비트 variant | 62비트 난수
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | (0x7 << 76)  # 버전 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class VideoUpload(models.Model):
     """
     Why: 동영상 업로드 메타데이터 관리
@@ -32,7 +48,8 @@ class VideoUpload(models.Model):
     ]
 
     # 기본 정보
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Why: 시간 순 UUIDv7로 PK 인덱스 삽입 지역성 확보 (기존 uuid4 행은 그대로 유지)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     # Why: settings.AUTH_USER_MODEL 사용으로 커스텀 User 모델과 연결
     uploader = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="maiu_uploads"
@@ -73,7 +90,31 @@ class VideoUpload(models.Model):
         indexes = [
             models.Index(fields=["uploader", "-created_at"]),
             models.Index(fields=["status"]),
-            models.Index(fields=["visibility", "-created_at"]),
+            # Why: 공개 목록(visibility="public", 최신순)은 공개 행만 담는 partial 인덱스로 처리
+            # (visibility 3가지 값 전체를 담던 복합 인덱스보다 작고, 비공개 업로드 시 갱신 없음)
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(visibility="public"),
+                name="maiu_public_created_idx",
+            ),
+            # Why: 업로드는 created_at 순으로만 추가되므로 기간 조회는 BRIN으로 충분
+            # (B-tree 대비 매우 작고, INSERT 시 리프 분할 없이 범위 요약 한 페이지만 갱신)
+            BrinIndex(
+                fields=["created_at"],
+                pages_per_range=32,
+                name="maiu_created_brin_idx",
+            ),
+            # Why: "내 업로드 중 특정 상태, 최신순" 조회를 단일 인덱스 범위 스캔으로 처리
+            models.Index(
+                fields=["uploader", "status", "-created_at"],
+                name="maiu_up_stat_created_idx",
+            ),
+            # Why: 진행 중인 업로드만 담는 partial 인덱스 (완료/실패 행은 제외되어 작게 유지)
+            models.Index(
+                fields=["uploader", "-created_at"],
+                condition=models.Q(status__in=["pending", "uploading", "processing"]),
+                name="maiu_active_uploads_idx",
+            ),
         ]
         ordering = ["-created_at"]
 
@@ -2,9 +2,18 @@
 Maiu API 시리얼라이저
 """
 
+from django.contrib.auth import get_user_model
+from django.db.models import OuterRef, Subquery
 from rest_framework import serializers
 from .models import VideoUpload, UploadChunk
 
+# Why: 허용 MIME 타입은 고정값이므로 모듈 로드 시 한 번만 구성 (frozenset으로 O(1) 조회)
+_ALLOWED_MIME_TYPE_LIST = ("video/mp4", "video/mov", "video/webm", "video/mkv")
+_ALLOWED_MIME_TYPES = frozenset(_ALLOWED_MIME_TYPE_LIST)
+_ALLOWED_MIME_TYPES_ERR = (
+    f"지원되지 않는 파일 형식입니다. 허용 형식: {', '.join(_ALLOWED_MIME_TYPE_LIST)}"
+)
+
 
 class InitiateUploadSerializer(serializers.Serializer):
     """
@@ -26,16 +35,8 @@ class InitiateUploadSerializer(serializers.Serializer):
         """
         Why: 동영상 파일만 허용
         """
-        allowed_types = [
-            "video/mp4",
-            "video/mov",
-            "video/webm",
-            "video/mkv",
-        ]
-        if value not in allowed_types:
-            raise serializers.ValidationError(
-                f"지원되지 않는 파일 형식입니다. 허용 형식: {', '.join(allowed_types)}"
-            )
+        if value not in _ALLOWED_MIME_TYPES:
+            raise serializers.ValidationError(_ALLOWED_MIME_TYPES_ERR)
         return value
 
 
@@ -44,9 +45,8 @@ class VideoUploadSerializer(serializers.ModelSerializer):
     Why: VideoUpload 모델 시리얼라이저
     """
 
-    uploader_username = serializers.CharField(
-        source="uploader.username", read_only=True
-    )
+    # Why: setup_eager_loading()의 annotation 값을 우선 사용 (User 객체 생성 없이 컬럼만 조회)
+    uploader_username = serializers.SerializerMethodField()
 
     class Meta:
         model = VideoUpload
@@ -65,6 +65,43 @@ class VideoUploadSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "uploader_username", "view_count"]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Why: 이 시리얼라이저가 참조하는 관계를 한 곳에서 관리 (N+1 쿼리 방지)
+        Why: 뷰는 queryset = VideoUploadSerializer.setup_eager_loading(queryset)만 호출
+        - uploader_username: username 컬럼만 상관 서브쿼리 annotation으로 가져옴
+          (select_related("uploader")처럼 User 행 전체를 읽고 객체를 만들 필요 없음)
+          (JOIN이 아니므로 페이지네이션 COUNT 쿼리에서는 통째로 제거됨)
+        - chunks는 현재 출력 필드에 없으므로 미리 로드하지 않음
+          (청크 필드 추가 시 Prefetch("chunks", queryset=UploadChunk.objects.only(...)) 사용)
+        - only(): 응답에 쓰는 컬럼만 SELECT (object_key, upload_id 등 저장소 정보 제외)
+          uploader_id는 권한 확인(uploader_id 비교)에 필요하므로 포함
+        """
+        uploader_username = get_user_model().objects.filter(pk=OuterRef("uploader_id"))
+        return queryset.annotate(
+            annotated_uploader_username=Subquery(
+                uploader_username.values("username")[:1]
+            )
+        ).only(
+            "id",
+            "uploader_id",
+            "title",
+            "description",
+            "original_filename",
+            "file_size",
+            "status",
+            "upload_progress",
+            "visibility",
+            "view_count",
+            "created_at",
+        )
+
+    def get_uploader_username(self, obj):
+        """업로더 username (annotation 우선, 없으면 관계 객체)"""
+        username = getattr(obj, "annotated_uploader_username", None)
+        return username if username is not None else obj.uploader.username
+
 
 class ChunkUploadSerializer(serializers.Serializer):
     """
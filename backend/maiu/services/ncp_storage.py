@@ -4,35 +4,113 @@ Why: 대용량 동영상 업로드를 위한 멀티파트 업로드 관리
 """
 
 import boto3
-import uuid
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+import hashlib
+import hmac
+import logging
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
 from django.conf import settings
 from typing import Dict, Any, List
 
 
+logger = logging.getLogger(__name__)
+
+
+class StorageError(Exception):
+    """
+    Why: NCP Object Storage 요청 실패를 호출부가 DB/프로그래밍 오류와 구분해 처리하도록
+    boto3 예외(ClientError, BotoCoreError)를 감싸는 예외
+    """
+
+
+# Why: S3 API 호출에서 발생하는 예외 (응답 오류 + 연결/자격 증명 등 클라이언트 오류)
+_S3_ERRORS = (BotoCoreError, ClientError)
+
+
+@lru_cache(maxsize=16)
+def _sigv4_signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """
+    Why: SigV4 서명 키는 (날짜, 리전, 서비스)가 같으면 동일하므로 한 번만 유도
+    """
+    key = f"AWS4{secret_key}".encode()
+    for msg in (date_stamp, region, "s3", "aws4_request"):
+        key = hmac.new(key, msg.encode(), hashlib.sha256).digest()
+    return key
+
+
+def _sigv4_quote(value: str) -> str:
+    """Why: SigV4 canonical query 인코딩 (RFC 3986 unreserved 문자만 유지)"""
+    return quote(value, safe="-_.~")
+
+
+# (초 단위 epoch, 포맷된 문자열) - 같은 초 안의 호출은 strftime 없이 재사용
+_last_key_timestamp = (0, "")
+
+
+def _key_timestamp() -> str:
+    """
+    Why: 오브젝트 키용 로컬 시각 문자열(YYYYMMDD_HHMMSS)을 초 단위로 캐시
+    Why: datetime 객체 생성과 strftime 포맷 처리를 초당 한 번으로 제한
+    """
+    global _last_key_timestamp
+    second = time.time_ns() // 1_000_000_000
+    cached_second, formatted = _last_key_timestamp
+    if second != cached_second:
+        formatted = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+        _last_key_timestamp = (second, formatted)
+    return formatted
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client():
+    """
+    Why: boto3 클라이언트 생성(서비스 모델 파싱, 엔드포인트 설정)은 비용이 크므로 프로세스당 한 번만 수행
+    Why: 클라이언트를 재사용해야 내부 HTTPS 커넥션 풀도 요청 간에 재사용됨
+    Why: boto3 클라이언트는 스레드 간 공유 가능 (세션 객체와 달리 thread-safe)
+    """
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.NCP_OBJECT_STORAGE_ENDPOINT,
+        aws_access_key_id=settings.NCP_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.NCP_SECRET_ACCESS_KEY,
+        region_name=settings.NCP_REGION,
+        config=Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
+
+
 class MaiuNCPStorageService:
     """
     Why: Maiu 전용 NCP Storage 서비스 (포트폴리오와 분리)
     """
 
     def __init__(self):
-        self.client = boto3.client(
-            "s3",
-            endpoint_url=settings.NCP_OBJECT_STORAGE_ENDPOINT,
-            aws_access_key_id=settings.NCP_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.NCP_SECRET_ACCESS_KEY,
-            region_name=settings.NCP_REGION,
-        )
+        self.client = _get_s3_client()
         self.bucket_name = settings.NCP_BUCKET_NAME
+        self.endpoint = urlsplit(settings.NCP_OBJECT_STORAGE_ENDPOINT)
+        # Why: 서명 URL의 고정 부분은 인스턴스(프로세스)당 한 번만 계산
+        # (path-style 주소 - 버킷 이름에 '.'이 포함되어 virtual-host 방식 사용 불가)
+        self.bucket_path = quote(f"/{self.bucket_name}/", safe="/~")
+        self.base_url = f"{self.endpoint.scheme}://{self.endpoint.netloc}"
 
     def generate_object_key(self, user_id: int, original_filename: str) -> str:
         """
         Why: maiu 전용 파일 경로 생성
         """
-        file_ext = os.path.splitext(original_filename)[1].lower()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = uuid.uuid4().hex[:12]
+        file_ext = os.path.splitext(original_filename)[1]
+        if file_ext:
+            file_ext = file_ext.lower()
+        timestamp = _key_timestamp()
+        # Why: 12자리 hex 난수 (UUID 객체/32자 문자열을 만들지 않고 6바이트만 생성)
+        unique_id = os.urandom(6).hex()
 
         return f"maiu/videos/{user_id}/{timestamp}_{unique_id}{file_ext}"
 
@@ -48,28 +126,68 @@ class MaiuNCPStorageService:
                 Metadata={"service": "maiu", "uploaded_at": datetime.now().isoformat()},
             )
             return response["UploadId"]
-        except Exception as e:
-            raise Exception(f"멀티파트 업로드 초기화 실패: {str(e)}")
+        except _S3_ERRORS as e:
+            raise StorageError(f"멀티파트 업로드 초기화 실패: {str(e)}") from e
 
-    def generate_presigned_part_url(
-        self, object_key: str, upload_id: str, part_number: int, expires_in: int = 3600
-    ) -> str:
+    def batch_presign_parts(
+        self,
+        object_key: str,
+        upload_id: str,
+        part_numbers: List[int],
+        expires_in: int = 3600,
+    ) -> List[str]:
         """
-        Why: 각 청크별 업로드 URL 생성
+        Why: 여러 청크의 업로드 URL을 한 번에 생성 (part_numbers와 같은 순서의 URL 목록)
+        Why: boto3는 URL마다 파라미터 검증, 이벤트 훅, 서명 키 유도를 반복하므로
+             SigV4 query 서명을 직접 수행
+        - 서명 키, 날짜/자격 증명 범위, 경로는 배치당 한 번만 계산
+        - 파트마다 달라지는 partNumber만 끼워 넣어 canonical request를 만들고 HMAC 한 번으로 서명
+          (파트별 dict 생성/정렬/퍼센트 인코딩 없음)
         """
-        try:
-            return self.client.generate_presigned_url(
-                "upload_part",
-                Params={
-                    "Bucket": self.bucket_name,
-                    "Key": object_key,
-                    "PartNumber": part_number,
-                    "UploadId": upload_id,
-                },
-                ExpiresIn=expires_in,
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        credential_scope = f"{date_stamp}/{settings.NCP_REGION}/s3/aws4_request"
+        signing_key = _sigv4_signing_key(
+            settings.NCP_SECRET_ACCESS_KEY, date_stamp, settings.NCP_REGION
+        )
+
+        host = self.endpoint.netloc
+        path = self.bucket_path + quote(object_key, safe="/~")
+        amz_query = {
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{settings.NCP_ACCESS_KEY_ID}/{credential_scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+        }
+
+        # Why: canonical query는 키의 바이트 순 정렬이므로 항상
+        # X-Amz-* < partNumber < uploadId 순서 - 파트마다 달라지는 partNumber를 제외한
+        # 앞/뒤 부분은 배치당 한 번만 인코딩하고, 파트마다 숫자만 끼워 넣음
+        # (partNumber 값은 숫자라 인코딩 불필요)
+        query_head = "&".join(
+            f"{_sigv4_quote(k)}={_sigv4_quote(v)}" for k, v in sorted(amz_query.items())
+        )
+        query_tail = f"&uploadId={_sigv4_quote(upload_id)}"
+        request_head = f"PUT\n{path}\n{query_head}&partNumber="
+        request_tail = f"{query_tail}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign_head = f"AWS4-HMAC-SHA256\n{amz_date}\n{credential_scope}\n"
+        url_head = f"{self.base_url}{path}?{query_head}&partNumber="
+
+        presigned_urls = []
+        for part_number in part_numbers:
+            canonical_request = f"{request_head}{part_number}{request_tail}"
+            string_to_sign = (
+                string_to_sign_head
+                + hashlib.sha256(canonical_request.encode()).hexdigest()
             )
-        except Exception as e:
-            raise Exception(f"파트 URL 생성 실패: {str(e)}")
+            signature = hmac.new(
+                signing_key, string_to_sign.encode(), hashlib.sha256
+            ).hexdigest()
+            presigned_urls.append(
+                f"{url_head}{part_number}{query_tail}&X-Amz-Signature={signature}"
+            )
+        return presigned_urls
 
     def complete_multipart_upload(
         self, object_key: str, upload_id: str, parts: List[Dict]
@@ -84,8 +202,22 @@ class MaiuNCPStorageService:
                 UploadId=upload_id,
                 MultipartUpload={"Parts": parts},
             )
-        except Exception as e:
-            raise Exception(f"업로드 완료 처리 실패: {str(e)}")
+        except _S3_ERRORS as e:
+            raise StorageError(f"업로드 완료 처리 실패: {str(e)}") from e
+
+    def object_exists(self, object_key: str) -> bool:
+        """
+        Why: 조합 재실행 실패(NoSuchUpload)가 이전 조합 성공 때문인지 확인
+        """
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=object_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise StorageError(f"오브젝트 조회 실패: {str(e)}") from e
+        except BotoCoreError as e:
+            raise StorageError(f"오브젝트 조회 실패: {str(e)}") from e
+        return True
 
     def abort_multipart_upload(self, object_key: str, upload_id: str) -> None:
         """
@@ -95,6 +227,8 @@ class MaiuNCPStorageService:
             self.client.abort_multipart_upload(
                 Bucket=self.bucket_name, Key=object_key, UploadId=upload_id
             )
-        except Exception as e:
+        except _S3_ERRORS:
             # Why: 정리 실패는 로그만 남기고 진행
-            print(f"업로드 정리 실패: {str(e)}")
+            logger.exception(
+                "업로드 정리 실패: %s (upload_id=%s)", object_key, upload_id
+            )
@@ -0,0 +1,147 @@
+"""
+업로드 마무리(파일 조합) 백그라운드 처리
+Why: S3 CompleteMultipartUpload는 대용량 파일에서 수 초 이상 걸리므로
+complete_upload 응답이 이를 기다리지 않도록 응답 이후에 수행
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import VideoUpload
+from .ncp_storage import MaiuNCPStorageService, StorageError
+
+logger = logging.getLogger(__name__)
+
+# 파일 조합 요청은 대부분 S3 응답 대기이므로 소수의 스레드로 충분
+_finalize_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="maiu-finalize"
+)
+
+# Why: 조합 작업은 프로세스 메모리(스레드 풀)에만 있어 재시작 시 유실될 수 있으므로
+# 이 시간이 지나도 "processing"인 업로드는 작업이 유실된 것으로 보고 다시 조합 허용
+FINALIZE_STALE_AFTER = timedelta(minutes=10)
+
+
+def finalize_startable() -> Q:
+    """
+    조합을 (다시) 시작할 수 있는 업로드 조건
+
+    Why: 완료/조합 중인 업로드는 제외하되 오래된 "processing"은 재실행 허용
+    """
+    stale_before = timezone.now() - FINALIZE_STALE_AFTER
+    return ~Q(status__in=["processing", "completed"]) | Q(
+        status="processing", updated_at__lt=stale_before
+    )
+
+
+def _finalize_upload(
+    storage_service: MaiuNCPStorageService,
+    video_upload_id,
+    object_key: str,
+    upload_id: str,
+    parts: List[Dict],
+) -> None:
+    """백그라운드 스레드에서 파일 조합 후 최종 상태 기록"""
+    # Why: 요청 밖의 스레드는 request_finished 신호를 받지 않으므로 커넥션 수명을 직접 관리
+    close_old_connections()
+    try:
+        # Why: "processing" 상태인 행만 갱신하여 그 사이 삭제/변경된 업로드를 덮어쓰지 않음
+        pending = VideoUpload.objects.filter(pk=video_upload_id, status="processing")
+        try:
+            storage_service.complete_multipart_upload(object_key, upload_id, parts)
+        except StorageError:
+            # Why: 유실된 작업을 재실행할 때 이전 조합이 이미 끝났다면 S3가 NoSuchUpload로
+            # 실패하므로, 오브젝트가 있으면 조합 완료로 처리
+            if not storage_service.object_exists(object_key):
+                logger.exception("업로드 파일 조합 실패: %s", video_upload_id)
+                pending.update(status="failed", updated_at=timezone.now())
+                return
+
+        now = timezone.now()
+        pending.update(
+            status="completed", upload_progress=100.0, completed_at=now, updated_at=now
+        )
+    except Exception:
+        # Why: 스레드 풀은 예외를 Future에 담아 버리므로 여기서 반드시 기록
+        logger.exception("업로드 완료 상태 저장 실패: %s", video_upload_id)
+    finally:
+        close_old_connections()
+
+
+def finalize_in_background(
+    storage_service: MaiuNCPStorageService,
+    video_upload_id,
+    object_key: str,
+    upload_id: str,
+    parts: List[Dict],
+) -> None:
+    """
+    멀티파트 업로드 조합과 최종 상태 기록을 응답 이후로 미룸
+
+    Why: 클라이언트는 상세 조회(status)로 완료 여부를 확인
+
+    Args:
+        storage_service (MaiuNCPStorageService): 저장소 서비스
+        video_upload_id: VideoUpload PK
+        object_key (str): 오브젝트 키
+        upload_id (str): 멀티파트 업로드 ID
+        parts (list): [{"PartNumber": int, "ETag": str}, ...]
+    """
+    _finalize_executor.submit(
+        _finalize_upload,
+        storage_service,
+        video_upload_id,
+        object_key,
+        upload_id,
+        parts,
+    )
+
+
+def recover_stale_uploads(storage_service: MaiuNCPStorageService) -> int:
+    """
+    작업이 유실된 "processing" 업로드를 저장된 파트 정보로 다시 조합
+
+    Why: 클라이언트가 재요청하지 않으면 유실된 업로드가 계속 "processing"으로 남으므로
+    주기 작업(recover_stale_uploads 명령)으로 정리
+
+    Args:
+        storage_service (MaiuNCPStorageService): 저장소 서비스
+
+    Returns:
+        int: 다시 조합한 업로드 수
+    """
+    stale = VideoUpload.objects.filter(finalize_startable(), status="processing").only(
+        "id", "object_key", "upload_id"
+    )
+
+    recovered = 0
+    for video_upload in stale:
+        # Why: 조건부 UPDATE로 선점하여 동시에 들어온 complete_upload 재요청과 중복 조합 방지
+        claimed = VideoUpload.objects.filter(
+            finalize_startable(), pk=video_upload.pk, status="processing"
+        ).update(updated_at=timezone.now())
+        if not claimed:
+            continue
+
+        parts = [
+            {"PartNumber": part_number, "ETag": etag}
+            for part_number, etag in video_upload.chunks.filter(
+                is_uploaded=True
+            ).values_list("part_number", "etag")
+        ]
+        _finalize_upload(
+            storage_service,
+            video_upload.pk,
+            video_upload.object_key,
+            video_upload.upload_id,
+            parts,
+        )
+        recovered += 1
+
+    return recovered
@@ -1,3 +1,91 @@
-from django.test import TestCase
+from datetime import datetime, timezone
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from .services import ncp_storage
+from .services.ncp_storage import MaiuNCPStorageService, _get_s3_client
+
+
+@override_settings(
+    NCP_OBJECT_STORAGE_ENDPOINT="https://kr.object.ncloudstorage.com",
+    NCP_ACCESS_KEY_ID="TESTACCESSKEY",
+    NCP_SECRET_ACCESS_KEY="test/secret+access=key",
+    NCP_REGION="kr-standard",
+    NCP_BUCKET_NAME="maiu.bucket.test",
+)
+class BatchPresignPartsTests(SimpleTestCase):
+    """
+    Why: batch_presign_parts는 SigV4 서명을 직접 수행하므로
+    같은 자격 증명/시각에서 boto3 generate_presigned_url과 같은 URL을 만드는지 확인
+    """
+
+    def setUp(self):
+        # Why: 캐시된 클라이언트는 테스트용 자격 증명과 다를 수 있으므로 새로 생성
+        _get_s3_client.cache_clear()
+        self.addCleanup(_get_s3_client.cache_clear)
+        self.service = MaiuNCPStorageService()
+
+    def boto3_presign(self, object_key, upload_id, part_number, expires_in=3600):
+        return self.service.client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.service.bucket_name,
+                "Key": object_key,
+                "PartNumber": part_number,
+                "UploadId": upload_id,
+            },
+            ExpiresIn=expires_in,
+        )
+
+    def batch_presign_at(self, signed_at, *args, **kwargs):
+        """boto3 URL이 서명된 시각으로 고정하여 batch_presign_parts 호출"""
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return signed_at
+
+        with mock.patch.object(ncp_storage, "datetime", FrozenDatetime):
+            return self.service.batch_presign_parts(*args, **kwargs)
+
+    def assertSameUrl(self, url, expected):
+        actual_parts, expected_parts = urlsplit(url), urlsplit(expected)
+        self.assertEqual(
+            (actual_parts.scheme, actual_parts.netloc, actual_parts.path),
+            (expected_parts.scheme, expected_parts.netloc, expected_parts.path),
+        )
+        self.assertEqual(
+            parse_qs(actual_parts.query, keep_blank_values=True),
+            parse_qs(expected_parts.query, keep_blank_values=True),
+        )
+
+    def test_matches_boto3_presigned_url(self):
+        cases = [
+            ("maiu/videos/1/20261015_152450_b1dc2bb1e10e.mp4", "UPID", [1, 7]),
+            ("maiu/videos/1/a b+c~d.mp4", "2~abc/def+ghi==", [9, 10000]),
+            ("maiu/videos/2/영상.mov", "x y", [1, 2, 123]),
+        ]
+        for object_key, upload_id, part_numbers in cases:
+            for expires_in in (3600, 60):
+                expected = [
+                    self.boto3_presign(object_key, upload_id, part_number, expires_in)
+                    for part_number in part_numbers
+                ]
+                amz_date = parse_qs(urlsplit(expected[0]).query)["X-Amz-Date"][0]
+                signed_at = datetime.strptime(amz_date, "%Y%m%dT%H%M%SZ").replace(
+                    tzinfo=timezone.utc
+                )
+
+                urls = self.batch_presign_at(
+                    signed_at, object_key, upload_id, part_numbers, expires_in
+                )
+
+                with self.subTest(object_key=object_key, expires_in=expires_in):
+                    self.assertEqual(len(urls), len(part_numbers))
+                    for url, expected_url in zip(urls, expected):
+                        self.assertSameUrl(url, expected_url)
+
+    def test_empty_part_numbers(self):
+        self.assertEqual(self.service.batch_presign_parts("k", "u", []), [])
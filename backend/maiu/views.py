@@ -3,15 +3,18 @@ Maiu API 뷰
 Why: 동영상 업로드 관련 모든 API 엔드포인트 관리
 """
 
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import render
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.utils import timezone
-from django.db import models, transaction
-import math
+from django.db import DatabaseError, transaction
+import hashlib
+from functools import lru_cache
 
 from .models import VideoUpload, UploadChunk
 from .serializers import (
@@ -19,7 +22,121 @@ from .serializers import (
     InitiateUploadSerializer,
     ChunkUploadSerializer,
 )
-from .services.ncp_storage import MaiuNCPStorageService
+from .services.ncp_storage import MaiuNCPStorageService, StorageError
+from .services.upload_finalize import finalize_in_background, finalize_startable
+
+# Why: 멀티파트 업로드 청크 크기 범위와 목표 파트 수 (2**7 = 128개 내외)
+# 청크가 너무 크면 실패 시 재전송량이 커지고 이어 올리기 단위가 거칠어지며,
+# 너무 작으면 파트마다 반복되는 서명/PUT 요청 비용이 전체 시간을 지배
+# (최대 크기는 S3 파트 크기 상한 5GiB)
+MIN_CHUNK_SIZE = 8 << 20
+MAX_CHUNK_SIZE = 5 << 30
+TARGET_PART_COUNT_BITS = 7
+
+# Why: ChunkUploadSerializer와 같은 제약 (S3 멀티파트 최대 파트 수 / ETag 길이)
+MAX_PART_NUMBER = 10000
+MAX_ETAG_LENGTH = 100
+
+# Why: initiate_upload 응답에 미리 서명해 넣을 최대 파트 수 (응답 크기 제한)
+# 이보다 뒤의 파트는 get_presigned_urls로 요청
+INITIATE_PRESIGN_LIMIT = 1000
+
+# Why: Presigned URL 유효 시간과 캐시 유지 시간 (초)
+# 캐시에서 꺼낸 URL도 최소 10분은 유효하도록 만료보다 짧게 유지
+PRESIGN_EXPIRES_IN = 3600
+PRESIGN_CACHE_TIMEOUT = PRESIGN_EXPIRES_IN - 600
+
+
+@lru_cache(maxsize=1)
+def _get_storage_service() -> MaiuNCPStorageService:
+    """
+    Why: 저장소 서비스는 상태가 없으므로 프로세스당 하나만 만들어 모든 요청에서 공유
+    Why: boto3 클라이언트는 스레드 간 공유 가능 (서명/HTTP 요청 모두 thread-safe)
+    """
+    return MaiuNCPStorageService()
+
+
+def _chunk_size_for(file_size: int) -> int:
+    """
+    파일 크기에 맞춘 청크 크기 (2의 거듭제곱 바이트)
+
+    Why: 고정 크기(100MB)는 작은 파일에선 파트가 1~2개뿐이고 큰 파일에선 파트 수가 크게 늘어나므로
+    파일 크기와 무관하게 파트 수가 64~128개 사이에 오도록 선택
+    (최소 크기보다 작은 파일은 파트 수가 더 적어짐)
+    """
+    chunk_size = 1 << max(file_size.bit_length() - TARGET_PART_COUNT_BITS, 0)
+    return min(max(chunk_size, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+
+def _presign_parts_cached(
+    storage_service: MaiuNCPStorageService,
+    object_key: str,
+    upload_id: str,
+    part_numbers: List[int],
+) -> List[str]:
+    """
+    캐시를 거치는 batch_presign_parts()
+
+    Why: 재시도/이어 올리기 시 같은 파트의 URL을 반복 요청하므로
+    아직 유효한 URL은 재사용하고 없는 파트만 서명 (캐시 조회/저장은 각각 한 번)
+
+    Returns:
+        list: part_numbers와 같은 순서의 URL 목록
+    """
+    # upload_id는 길이가 정해져 있지 않으므로 다이제스트로 캐시 키 길이 고정
+    digest = hashlib.blake2b(
+        f"{object_key}\0{upload_id}".encode(), digest_size=16
+    ).hexdigest()
+    keys = [f"maiu-presign:{digest}:{part_number}" for part_number in part_numbers]
+    cached = cache.get_many(keys)
+
+    missing = [
+        (key, part_number)
+        for key, part_number in zip(keys, part_numbers)
+        if key not in cached
+    ]
+    if missing:
+        urls = storage_service.batch_presign_parts(
+            object_key,
+            upload_id,
+            [part_number for _, part_number in missing],
+            expires_in=PRESIGN_EXPIRES_IN,
+        )
+        signed = {key: url for (key, _), url in zip(missing, urls)}
+        cache.set_many(signed, PRESIGN_CACHE_TIMEOUT)
+        cached.update(signed)
+
+    return [cached[key] for key in keys]
+
+
+def _validate_parts(raw_parts) -> Optional[List[Tuple[int, str]]]:
+    """
+    complete_upload의 파트 목록을 한 번의 순회로 검증
+
+    Why: 파트마다 시리얼라이저 인스턴스와 필드 검증기를 만드는 ChunkUploadSerializer(many=True)는
+    수천 개 파트에서 응답 시간 대부분을 차지하므로, 같은 제약을 튜플 변환 + 단순 비교로 확인
+
+    Args:
+        raw_parts: 요청의 "parts" 값 ([{"part_number": int, "etag": str}, ...])
+
+    Returns:
+        list | None: [(part_number, etag), ...] 또는 하나라도 잘못되면 None
+    """
+    try:
+        parts = [(part["part_number"], part["etag"]) for part in raw_parts]
+    except (TypeError, KeyError):
+        return None
+
+    # bool은 int의 하위 클래스이므로 type()으로 정확히 비교
+    if all(
+        type(part_number) is int
+        and 1 <= part_number <= MAX_PART_NUMBER
+        and type(etag) is str
+        and 0 < len(etag) <= MAX_ETAG_LENGTH
+        for part_number, etag in parts
+    ):
+        return parts
+    return None
 
 
 class MaiuVideoViewSet(viewsets.ModelViewSet):
@@ -44,18 +161,41 @@ class MaiuVideoViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         Why: 사용자별 및 공개 설정에 따른 필터링
-        Why: select_related로 N+1 쿼리 방지
+        Why: 관계 로딩은 시리얼라이저의 setup_eager_loading()에 위임하여 N+1 쿼리 방지
+        Why: 컬럼 축소(only)는 액션별로 실제 사용하는 컬럼 기준으로 적용
+             (조회 액션은 응답 컬럼, 업로드 액션은 object_key/upload_id 등 저장소 컬럼)
         """
         if self.request.user.is_authenticated:
             # 로그인한 사용자는 자신의 모든 동영상 + 공개 동영상
-            return VideoUpload.objects.filter(
-                models.Q(uploader=self.request.user) | models.Q(visibility="public")
-            ).select_related("uploader")
+            # Why: OR 조건은 두 인덱스를 BitmapOr로 합쳐야 하므로, 각 조건이 자기 인덱스
+            # ((uploader, -created_at) / 공개 부분 인덱스)만 타는 두 id 쿼리의 UNION으로 분리
+            # (겹치는 본인 공개 동영상은 UNION이 제거, id만 합치므로 중복 비교 비용도 작음)
+            # 결합 쿼리를 pk__in 조건으로 감싸 get_object()의 filter()도 그대로 동작
+            own_ids = VideoUpload.objects.filter(uploader=self.request.user)
+            public_ids = VideoUpload.objects.filter(visibility="public")
+            queryset = VideoUpload.objects.filter(
+                pk__in=own_ids.order_by()
+                .values("pk")
+                .union(public_ids.order_by().values("pk"))
+            )
         else:
             # 비로그인 사용자는 공개 동영상만
-            return VideoUpload.objects.filter(visibility="public").select_related(
-                "uploader"
+            queryset = VideoUpload.objects.filter(visibility="public")
+
+        if self.action in ["list", "retrieve"]:
+            return VideoUploadSerializer.setup_eager_loading(queryset)
+        if self.action in ["get_presigned_urls", "complete_upload"]:
+            # Why: 업로드 액션은 권한 확인(uploader_id)과 저장소/상태 컬럼만 사용
+            # (description 등 나머지 컬럼은 읽지 않음)
+            return queryset.only(
+                "id",
+                "uploader_id",
+                "object_key",
+                "upload_id",
+                "status",
+                "upload_progress",
             )
+        return queryset
 
     @action(detail=False, methods=["post"])
     def initiate_upload(self, request):
@@ -67,48 +207,57 @@ class MaiuVideoViewSet(viewsets.ModelViewSet):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            with transaction.atomic():
-                # Why: 서비스 레이어를 통한 비즈니스 로직 분리
-                storage_service = MaiuNCPStorageService()
+        # Why: 서비스 레이어를 통한 비즈니스 로직 분리
+        storage_service = _get_storage_service()
 
-                # Why: Type-safe한 접근을 위해 명시적 타입 체크와 할당
-                validated_data: Dict[str, Any] = getattr(
-                    serializer, "validated_data", {}
-                )
+        # Why: Type-safe한 접근을 위해 명시적 타입 체크와 할당
+        validated_data: Dict[str, Any] = getattr(serializer, "validated_data", {})
 
-                if not validated_data:
-                    return Response(
-                        {"error": "검증된 데이터가 없습니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+        if not validated_data:
+            return Response(
+                {"error": "검증된 데이터가 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-                # Why: 필요한 필드들을 개별적으로 추출하여 타입 안전성 확보
-                title: str = validated_data.get("title", "")
-                description: str = validated_data.get("description", "")
-                original_filename: str = validated_data.get("original_filename", "")
-                file_size: int = validated_data.get("file_size", 0)
-                mime_type: str = validated_data.get("mime_type", "video/mp4")
-                visibility: str = validated_data.get("visibility", "private")
-
-                # Why: 필수 필드 검증 (Security First)
-                if not all([title, original_filename, file_size > 0, mime_type]):
-                    return Response(
-                        {"error": "필수 필드가 누락되었습니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+        # Why: 필요한 필드들을 개별적으로 추출하여 타입 안전성 확보
+        title: str = validated_data.get("title", "")
+        description: str = validated_data.get("description", "")
+        original_filename: str = validated_data.get("original_filename", "")
+        file_size: int = validated_data.get("file_size", 0)
+        mime_type: str = validated_data.get("mime_type", "video/mp4")
+        visibility: str = validated_data.get("visibility", "private")
 
-                # 1. 유니크 오브젝트 키 생성
-                object_key = storage_service.generate_object_key(
-                    request.user.id, original_filename
-                )
+        # Why: 필수 필드 검증 (Security First)
+        if not all([title, original_filename, file_size > 0, mime_type]):
+            return Response(
+                {"error": "필수 필드가 누락되었습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-                # 2. 멀티파트 업로드 초기화
-                upload_id = storage_service.initiate_multipart_upload(
-                    object_key, mime_type
-                )
+        # 1. 유니크 오브젝트 키 생성
+        object_key = storage_service.generate_object_key(
+            request.user.id, original_filename
+        )
+
+        # 2. 멀티파트 업로드 초기화
+        # Why: S3 왕복 동안 DB 트랜잭션(커넥션/락)을 잡고 있지 않도록
+        # 외부 호출은 트랜잭션 밖에서 먼저 수행
+        try:
+            upload_id = storage_service.initiate_multipart_upload(object_key, mime_type)
+        except StorageError as e:
+            return Response(
+                {"error": f"업로드 초기화 실패: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        # 3. 청크 정보 계산 (파일 크기에 따라 8MiB ~ 5GiB)
+        # Why: 정수 올림 나눗셈 (float 나눗셈은 2**53 이상에서 정밀도 손실)
+        chunk_size = _chunk_size_for(file_size)
+        total_chunks = (file_size + chunk_size - 1) // chunk_size
 
-                # 3. DB에 VideoUpload 레코드 생성
+        try:
+            with transaction.atomic():
+                # 4. DB에 VideoUpload 레코드 생성
                 video_upload = VideoUpload.objects.create(
                     uploader=request.user,
                     title=title,
@@ -123,140 +272,221 @@ class MaiuVideoViewSet(viewsets.ModelViewSet):
                     status="pending",
                 )
 
-                # 4. 청크 정보 계산 (100MB per chunk)
-                chunk_size = 100 * 1024 * 1024  # 100MB
-                total_chunks = math.ceil(file_size / chunk_size)
-
-                return Response(
-                    {
-                        "video_upload_id": str(video_upload.id),
-                        "upload_id": upload_id,
-                        "object_key": object_key,
-                        "chunk_size": chunk_size,
-                        "total_chunks": total_chunks,
-                        "message": "업로드가 초기화되었습니다.",
-                    }
+                # 5. 청크 추적 행 일괄 생성 (파트 수를 미리 알 수 있으므로 INSERT 한 번)
+                UploadChunk.objects.bulk_create(
+                    [
+                        UploadChunk(
+                            video_upload=video_upload,
+                            part_number=part_number,
+                            # 마지막 청크만 남은 크기
+                            size=min(
+                                chunk_size, file_size - (part_number - 1) * chunk_size
+                            ),
+                        )
+                        for part_number in range(1, total_chunks + 1)
+                    ],
+                    batch_size=500,
                 )
 
-        except Exception as e:
+        except DatabaseError as e:
+            # Why: DB 기록에 실패하면 아무도 참조하지 않는 멀티파트 업로드가 남으므로 정리
+            # (abort_multipart_upload는 정리 실패를 자체적으로 삼킴)
+            storage_service.abort_multipart_upload(object_key, upload_id)
             return Response(
                 {"error": f"업로드 초기화 실패: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        # 6. 앞쪽 파트의 Presigned URL을 미리 발급
+        # Why: 파트 수를 이미 알고 있으므로 get_presigned_urls 왕복 없이 바로 업로드 시작
+        # (서명은 네트워크 없이 로컬 HMAC 계산만 수행)
+        presign_part_numbers = list(
+            range(1, min(total_chunks, INITIATE_PRESIGN_LIMIT) + 1)
+        )
+        urls = _presign_parts_cached(
+            storage_service, object_key, upload_id, presign_part_numbers
+        )
+
+        return Response(
+            {
+                "video_upload_id": str(video_upload.id),
+                "upload_id": upload_id,
+                "object_key": object_key,
+                "chunk_size": chunk_size,
+                "total_chunks": total_chunks,
+                "presigned_urls": [
+                    {"part_number": part_number, "presigned_url": url}
+                    for part_number, url in zip(presign_part_numbers, urls)
+                ],
+                "message": "업로드가 초기화되었습니다.",
+            }
+        )
+
     @action(detail=True, methods=["post"])
     def get_presigned_urls(self, request, pk=None):
         """
         Why: 청크별 Presigned URL 제공
         Why: 대용량 파일의 멀티파트 업로드 지원
+        Why: part_numbers를 생략하면 아직 업로드되지 않은 모든 파트의 URL을 한 번에 반환
+             (클라이언트가 요청 한 번으로 전체 URL을 받아 업로드를 연속 진행)
         """
         video_upload = self.get_object()
 
         # Why: Security First - 업로더만 접근 가능
-        if video_upload.uploader != request.user:
+        if video_upload.uploader_id != request.user.pk:
             return Response(
                 {"error": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        try:
-            part_numbers = request.data.get("part_numbers", [])
-            if not part_numbers:
-                return Response(
-                    {"error": "part_numbers가 필요합니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            storage_service = MaiuNCPStorageService()
-            presigned_urls = []
-
-            for part_number in part_numbers:
-                url = storage_service.generate_presigned_part_url(
-                    video_upload.object_key, video_upload.upload_id, part_number
+        part_numbers = request.data.get("part_numbers")
+        if part_numbers is None:
+            part_numbers = list(
+                video_upload.chunks.filter(is_uploaded=False).values_list(
+                    "part_number", flat=True
                 )
-                presigned_urls.append(
-                    {"part_number": part_number, "presigned_url": url}
-                )
-
-            return Response({"presigned_urls": presigned_urls})
-
-        except Exception as e:
+            )
+        elif not (
+            isinstance(part_numbers, list)
+            and all(
+                type(part_number) is int and 1 <= part_number <= MAX_PART_NUMBER
+                for part_number in part_numbers
+            )
+        ):
             return Response(
-                {"error": f"URL 생성 실패: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "part_numbers는 1~10000 사이 정수 목록이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not part_numbers:
+            return Response(
+                {"error": "part_numbers가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Why: 서명은 로컬 계산이므로 외부 호출 실패를 감쌀 필요 없음
+        # (입력은 위에서 검증, 예상치 못한 오류는 DRF 기본 500 처리)
+        storage_service = _get_storage_service()
+        urls = _presign_parts_cached(
+            storage_service,
+            video_upload.object_key,
+            video_upload.upload_id,
+            part_numbers,
+        )
+        presigned_urls = [
+            {"part_number": part_number, "presigned_url": url}
+            for part_number, url in zip(part_numbers, urls)
+        ]
+
+        return Response({"presigned_urls": presigned_urls})
+
     @action(detail=True, methods=["post"])
     def complete_upload(self, request, pk=None):
         """
         Why: 모든 청크 업로드 완료 후 파일 조합
         Why: 트랜잭션으로 데이터 일관성 보장
+        Why: 파일 조합은 백그라운드에서 수행하고 202 반환 (완료 여부는 상세 조회로 확인)
         """
         video_upload = self.get_object()
 
         # Why: Security First - 권한 체크
-        if video_upload.uploader != request.user:
+        if video_upload.uploader_id != request.user.pk:
             return Response(
                 {"error": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        serializer = ChunkUploadSerializer(
-            data=request.data.get("parts", []), many=True
-        )
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-        try:
-            with transaction.atomic():
-                storage_service = MaiuNCPStorageService()
-
-                # Why: Type-safe한 접근을 위해 명시적 타입 체크와 할당
-                validated_data: list = getattr(serializer, "validated_data", [])
+        raw_parts = request.data.get("parts", [])
 
-                if not validated_data:
-                    return Response(
-                        {"error": "검증된 데이터가 없습니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+        if settings.MAIU_STRICT_PART_VALIDATION:
+            # Why: 필드별 상세 오류가 필요할 때만 DRF 검증 수행 (설정으로 활성화)
+            serializer = ChunkUploadSerializer(data=raw_parts, many=True)
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-                # Parts 정보 구성
-                parts = []
-                for part in validated_data:
-                    part_number = part.get("part_number")
-                    etag = part.get("etag")
+        validated_parts = _validate_parts(raw_parts)
+        if not validated_parts:
+            return Response(
+                {"error": "유효한 파트 정보가 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-                    if part_number and etag:
-                        parts.append({"PartNumber": part_number, "ETag": etag})
+        # Parts 정보 구성
+        parts = [
+            {"PartNumber": part_number, "ETag": etag}
+            for part_number, etag in validated_parts
+        ]
 
-                if not parts:
-                    return Response(
-                        {"error": "유효한 파트 정보가 없습니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
+        try:
+            with transaction.atomic():
+                # Why: 조건부 UPDATE로 한 업로드의 조합을 한 번만 시작
+                # (이미 조합 중/완료된 업로드를 다시 조합하면 S3가 NoSuchUpload로 실패하여
+                #  정상 파일이 failed로 바뀜 - 동시 재요청도 행 잠금으로 하나만 통과)
+                # 단, 작업이 유실된 오래된 "processing"은 재요청으로 다시 조합
+                started = VideoUpload.objects.filter(
+                    finalize_startable(), pk=video_upload.pk
+                ).update(status="processing", updated_at=timezone.now())
+                if not started:
+                    current_status = (
+                        VideoUpload.objects.filter(pk=video_upload.pk)
+                        .values_list("status", flat=True)
+                        .first()
                     )
-
-                # NCP에서 파일 조합 완료
-                storage_service.complete_multipart_upload(
-                    video_upload.object_key, video_upload.upload_id, parts
+                    if current_status == "processing":
+                        error = "업로드 파일을 조합하고 있습니다."
+                    else:
+                        error = "이미 완료 처리된 업로드입니다."
+                    return Response({"error": error}, status=status.HTTP_409_CONFLICT)
+                video_upload.status = "processing"
+
+                # 청크 업로드 완료 표시 (etag 저장) - 파트 수와 무관하게 UPSERT 한 번
+                UploadChunk.objects.bulk_create(
+                    [
+                        UploadChunk(
+                            video_upload=video_upload,
+                            part_number=part["PartNumber"],
+                            etag=part["ETag"],
+                            size=0,  # 초기화 시 생성된 행이 있으면 기존 크기 유지
+                            is_uploaded=True,
+                        )
+                        for part in parts
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["video_upload", "part_number"],
+                    update_fields=["etag", "is_uploaded"],
+                    batch_size=500,
                 )
 
-                # DB 상태 업데이트
-                video_upload.status = "completed"
-                video_upload.upload_progress = 100.0
-                video_upload.completed_at = timezone.now()
-                video_upload.save()
-
-                return Response(
-                    {
-                        "message": "업로드가 완료되었습니다.",
-                        "video_upload": VideoUploadSerializer(video_upload).data,
-                    }
+                # Why: NCP 파일 조합(수 초 이상 소요)은 커밋 이후 백그라운드에서 수행하고
+                # 완료/실패 상태는 상세 조회로 확인
+                storage_service = _get_storage_service()
+                transaction.on_commit(
+                    lambda: finalize_in_background(
+                        storage_service,
+                        video_upload.pk,
+                        video_upload.object_key,
+                        video_upload.upload_id,
+                        parts,
+                    )
                 )
 
-        except Exception as e:
+        except DatabaseError as e:
             # Why: 실패 시 명시적으로 상태 업데이트
             video_upload.status = "failed"
-            video_upload.save()
+            video_upload.save(update_fields=["status", "updated_at"])
 
             return Response(
                 {"error": f"업로드 완료 실패: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+        return Response(
+            {
+                "message": "업로드 파일을 조합하고 있습니다.",
+                # Why: 방금 바꾼 상태 필드만 직접 구성
+                # (시리얼라이저 재실행 시 uploader 조회 등 불필요한 작업 발생)
+                "video_upload": {
+                    "id": str(video_upload.id),
+                    "status": video_upload.status,
+                    "upload_progress": video_upload.upload_progress,
+                },
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -20,6 +20,8 @@ export interface InitiateUploadResponse {
   object_key: string;
   chunk_size: number;
   total_chunks: number;
+  // 앞쪽 파트(최대 1000개)의 URL - 나머지는 getPresignedUrls로 요청
+  presigned_urls: PresignedUrlResponse['presigned_urls'];
   message: string;
 }
 
@@ -42,6 +44,12 @@ export interface VideoUpload {
   uploader_username: string;
 }
 
+export interface CompleteUploadResponse {
+  message: string;
+  // 파일 조합은 서버에서 비동기로 진행 (status: 'processing')
+  video_upload: Pick<VideoUpload, 'id' | 'status' | 'upload_progress'>;
+}
+
 /**
  * Maiu API 함수들
  */
@@ -87,7 +95,7 @@ export const maiuAPI = {
   async completeUpload(
     videoUploadId: string,
     parts: Array<{ part_number: number; etag: string }>
-  ): Promise<{ message: string; video_upload: VideoUpload }> {
+  ): Promise<CompleteUploadResponse> {
     try {
       const response = await apiClient.post(
         `/maiu/videos/${videoUploadId}/complete_upload/`,
@@ -99,6 +107,19 @@ export const maiuAPI = {
     }
   },
 
+  /**
+   * 업로드 상세 조회
+   * Why: 서버에서 비동기로 진행되는 파일 조합의 완료/실패 확인
+   */
+  async getUpload(videoUploadId: string): Promise<VideoUpload> {
+    try {
+      const response = await apiClient.get(`/maiu/videos/${videoUploadId}/`);
+      return response.data;
+    } catch (error) {
+      throw new Error(`업로드 조회 실패: ${error}`);
+    }
+  },
+
   /**
    * 업로드 목록 조회
    * Why: 사용자의 업로드된 동영상 목록 표시
@@ -3,7 +3,63 @@
  */
 
 import { create } from 'zustand';
-import { maiuAPI, VideoUpload, VideoUploadData } from '../services/api/maiu';
+import {
+  maiuAPI,
+  PresignedUrlResponse,
+  VideoUpload,
+  VideoUploadData,
+} from '../services/api/maiu';
+
+// 파일 조합(서버 비동기 처리) 완료 확인 간격과 최대 대기 시간
+const FINALIZE_POLL_INTERVAL_MS = 2000;
+const FINALIZE_POLL_TIMEOUT_MS = 10 * 60 * 1000;
+
+/**
+ * 파일 조합이 끝날 때까지 업로드 상태 조회
+ * Why: complete_upload는 202만 반환하므로 조합 실패를 여기서 확인해야 함
+ */
+const waitForFinalize = async (videoUploadId: string): Promise<void> => {
+  const deadline = Date.now() + FINALIZE_POLL_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise(resolve =>
+      setTimeout(resolve, FINALIZE_POLL_INTERVAL_MS)
+    );
+    const { status } = await maiuAPI.getUpload(videoUploadId);
+    if (status === 'completed') {
+      return;
+    }
+    if (status === 'failed') {
+      throw new Error('업로드 파일 조합에 실패했습니다.');
+    }
+  }
+  throw new Error('업로드 파일 조합이 지연되고 있습니다.');
+};
+
+// Presigned URL의 남은 유효 시간이 이보다 짧으면 업로드 전에 새로 발급
+// (서버는 최소 10분 이상 남은 URL만 반환)
+const PRESIGNED_URL_EXPIRY_MARGIN_MS = 5 * 60 * 1000;
+// URL을 새로 요청할 때 함께 받을 파트 수 (파트마다 왕복하지 않도록)
+const PRESIGNED_URL_BATCH_SIZE = 100;
+
+/**
+ * Presigned URL 만료 시각 (epoch ms)
+ * Why: URL은 서명 시각(X-Amz-Date)부터 X-Amz-Expires초 동안만 유효하므로
+ * 업로드가 길어지면 미리 받아 둔 URL이 만료됨
+ */
+const presignedUrlExpiresAt = (url: string): number => {
+  const params = new URL(url).searchParams;
+  const signedAt = params
+    .get('X-Amz-Date')
+    ?.match(/^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z$/);
+  const expiresIn = Number(params.get('X-Amz-Expires'));
+  if (!signedAt || !expiresIn) {
+    return 0;
+  }
+  const [, year, month, day, hour, minute, second] = signedAt.map(Number);
+  return (
+    Date.UTC(year, month - 1, day, hour, minute, second) + expiresIn * 1000
+  );
+};
 
 interface UploadProgress {
   uploadId: string;
@@ -34,7 +90,8 @@ interface MaiuState {
     videoUploadId: string,
     uploadId: string,
     chunkSize: number,
-    totalChunks: number
+    totalChunks: number,
+    presignedUrls?: PresignedUrlResponse['presigned_urls']
   ) => Promise<void>;
 }
 
@@ -80,8 +137,13 @@ export const useMaiuStore = create<MaiuState>((set, get) => ({
         visibility: uploadData.visibility,
       });
 
-      const { video_upload_id, upload_id, chunk_size, total_chunks } =
-        initResponse;
+      const {
+        video_upload_id,
+        upload_id,
+        chunk_size,
+        total_chunks,
+        presigned_urls,
+      } = initResponse;
 
       // 2. 진행률 추적 시작
       set(state => ({
@@ -103,7 +165,8 @@ export const useMaiuStore = create<MaiuState>((set, get) => ({
         video_upload_id,
         upload_id,
         chunk_size,
-        total_chunks
+        total_chunks,
+        presigned_urls
       );
     } catch (error) {
       const errorMessage =
@@ -124,9 +187,51 @@ export const useMaiuStore = create<MaiuState>((set, get) => ({
     videoUploadId,
     uploadId,
     chunkSize,
-    totalChunks
+    totalChunks,
+    presignedUrls = []
   ) => {
     const chunks: Array<{ part_number: number; etag: string }> = [];
+    // initiate 응답에 포함된 URL은 만료 전까지 추가 요청 없이 사용
+    const knownUrls = new Map(
+      presignedUrls.map(({ part_number, presigned_url }) => [
+        part_number,
+        presigned_url,
+      ])
+    );
+
+    // partNumber부터 PRESIGNED_URL_BATCH_SIZE개 파트의 URL을 새로 발급받음
+    const refreshUrls = async (partNumber: number): Promise<string> => {
+      const lastPart = Math.min(
+        partNumber + PRESIGNED_URL_BATCH_SIZE - 1,
+        totalChunks
+      );
+      const partNumbers = Array.from(
+        { length: lastPart - partNumber + 1 },
+        (_, index) => partNumber + index
+      );
+      const urlResponse = await maiuAPI.getPresignedUrls(
+        videoUploadId,
+        partNumbers
+      );
+      urlResponse.presigned_urls.forEach(({ part_number, presigned_url }) =>
+        knownUrls.set(part_number, presigned_url)
+      );
+
+      const presignedUrl = knownUrls.get(partNumber);
+      if (!presignedUrl) {
+        throw new Error(`청크 ${partNumber} 업로드 URL 발급 실패`);
+      }
+      return presignedUrl;
+    };
+
+    const putChunk = (presignedUrl: string, chunk: Blob) =>
+      fetch(presignedUrl, {
+        method: 'PUT',
+        body: chunk,
+        headers: {
+          'Content-Type': 'application/octet-stream',
+        },
+      });
 
     try {
       for (let i = 0; i < totalChunks; i++) {
@@ -135,20 +240,25 @@ export const useMaiuStore = create<MaiuState>((set, get) => ({
         const end = Math.min(start + chunkSize, file.size);
         const chunk = file.slice(start, end);
 
-        // Presigned URL 요청
-        const urlResponse = await maiuAPI.getPresignedUrls(videoUploadId, [
-          partNumber,
-        ]);
-        const presignedUrl = urlResponse.presigned_urls[0].presigned_url;
+        // Presigned URL (미리 받지 못했거나 곧 만료되는 파트만 요청)
+        let presignedUrl = knownUrls.get(partNumber);
+        if (
+          !presignedUrl ||
+          presignedUrlExpiresAt(presignedUrl) - Date.now() <
+            PRESIGNED_URL_EXPIRY_MARGIN_MS
+        ) {
+          presignedUrl = await refreshUrls(partNumber);
+        }
 
         // 청크를 NCP Storage로 직접 업로드
-        const uploadResponse = await fetch(presignedUrl, {
-          method: 'PUT',
-          body: chunk,
-          headers: {
-            'Content-Type': 'application/octet-stream',
-          },
-        });
+        let uploadResponse = await putChunk(presignedUrl, chunk);
+
+        // Why: 기기 시계가 어긋나면 만료 판단이 틀릴 수 있으므로
+        // 403(만료된 서명)이면 새 URL로 한 번 더 시도
+        if (uploadResponse.status === 403) {
+          presignedUrl = await refreshUrls(partNumber);
+          uploadResponse = await putChunk(presignedUrl, chunk);
+        }
 
         if (!uploadResponse.ok) {
           throw new Error(`청크 ${partNumber} 업로드 실패`);
@@ -170,6 +280,7 @@ export const useMaiuStore = create<MaiuState>((set, get) => ({
       // 업로드 완료 알림
       get().updateProgress(videoUploadId, { status: 'processing' });
       await maiuAPI.completeUpload(videoUploadId, chunks);
+      await waitForFinalize(videoUploadId);
 
       // 상태 정리
       set(state => {
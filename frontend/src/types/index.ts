@@ -18,7 +18,7 @@ export interface User {
 
   // 연락처 정보
   website: string; // URLField, blank=True
-  phone_number: string; // 정규식 검증, max_length=17
+  phone_number: string; // E.164 형식(+821012345678)으로 저장, max_length=17
 
   // 이미지 및 설정
   profile_image: string | null; // ImageField, upload_to="profiles/%Y/%m/"